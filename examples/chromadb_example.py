@@ -35,7 +35,7 @@ async def main():
     project_root = str(Path.cwd())
     await context_manager.initialize(project_root)
     
-    std_logger.info(f"Memory store type: {type(context_manager.memory_store).__name__}")
+    std_logger.info("Memory store type: %s", type(context_manager.memory_store).__name__)
     
     # Test storing and retrieving data
     await test_memory_operations(context_manager, std_logger)
@@ -46,44 +46,48 @@ async def main():
 async def test_memory_operations(context_manager, logger):
     """Test basic memory operations with ChromaDB"""
     memory_store = context_manager.memory_store
-    
-    # Store a conversation
-    await memory_store.store_conversation({
-        "query": "How do I use ChromaDB with K2Edit?",
-        "context": {"file_path": "examples/chromadb_example.py"}
-    })
-    logger.info("Stored conversation in ChromaDB")
-    
-    # Store code context
-    await memory_store.store_context("examples/chromadb_example.py", {
-        "language": "python",
-        "symbols": ["main", "test_memory_operations"],
-        "dependencies": ["asyncio", "logging", "pathlib"]
-    })
-    logger.info("Stored code context in ChromaDB")
-    
-    # Store a code pattern
-    await memory_store.store_pattern(
-        "async_function",
-        "async def main():\n    pass",
-        {"language": "python", "category": "async"}
+    pattern_code = "async def main():\n    pass"
+
+    # Encode the pattern and both search queries in one model call; the store and
+    # searches below then reuse the cached vectors instead of encoding each text
+    await memory_store.embed_batch([pattern_code, "ChromaDB usage", "async def"])
+
+    # Queue the conversation and code context together so the store's background
+    # writer persists them in a single upsert; the pattern goes to its own collection
+    await asyncio.gather(
+        memory_store.store_conversation({
+            "query": "How do I use ChromaDB with K2Edit?",
+            "context": {"file_path": "examples/chromadb_example.py"}
+        }),
+        memory_store.store_context("examples/chromadb_example.py", {
+            "language": "python",
+            "symbols": ["main", "test_memory_operations"],
+            "dependencies": ["asyncio", "logging", "pathlib"]
+        }),
+        memory_store.store_pattern(
+            "async_function",
+            pattern_code,
+            {"language": "python", "category": "async"}
+        ),
     )
-    logger.info("Stored code pattern in ChromaDB")
     
-    # Perform semantic search
-    results = await memory_store.semantic_search("ChromaDB usage", limit=3)
-    logger.info(f"Semantic search returned {len(results)} results")
+    # Wait for the batched write to land before searching it
+    await memory_store.flush()
+    logger.info("Stored conversation, code context and code pattern in ChromaDB")
     
-    for i, result in enumerate(results):
-        logger.info(f"Result {i+1}: {result.get('metadata', {}).get('type', 'unknown')} (similarity: {result.get('similarity', 0):.3f})")
+    # The reads are independent of each other; run them concurrently
+    results, similar_code, recent = await asyncio.gather(
+        memory_store.semantic_search("ChromaDB usage", limit=3),
+        memory_store.find_similar_code("async def", limit=2),
+        memory_store.get_recent_conversations(limit=5),
+    )
     
-    # Find similar code
-    similar_code = await memory_store.find_similar_code("async def", limit=2)
-    logger.info(f"Found {len(similar_code)} similar code patterns")
+    logger.info("Semantic search returned %s results", len(results))
+    for i, result in enumerate(results):
+        logger.info("Result %s: %s (similarity: %.3f)", i+1, result.get('metadata', {}).get('type', 'unknown'), result.get('similarity', 0))
     
-    # Get recent conversations
-    recent = await memory_store.get_recent_conversations(limit=5)
-    logger.info(f"Retrieved {len(recent)} recent conversations")
+    logger.info("Found %s similar code patterns", len(similar_code))
+    logger.info("Retrieved %s recent conversations", len(recent))
 
 
 def demonstrate_configuration():
@@ -113,6 +117,17 @@ def demonstrate_configuration():
            "allow_reset": True
        }
    )
+   """)
+    
+    # Method 4: ChromaDB server through the asyncio client
+    print("\n4. Async Client (ChromaDB server):")
+    print("""
+   config = MemoryStoreConfig(
+       chroma_host="localhost",
+       chroma_port=8000,
+       async_mode=True  # or K2EDIT_CHROMA_ASYNC=1 with MemoryStoreConfig.from_env()
+   )
+   memory_store = create_memory_store(context_manager, logger, config)
    """)
     
     print("\n=== Benefits of ChromaDB over SQLite ===")
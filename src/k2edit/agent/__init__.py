@@ -3,6 +3,7 @@ K2Edit Agentic System
 Comprehensive solution for agentic context, memory, and LSP indexing
 """
 
+import asyncio
 from aiologger import Logger
 from typing import Dict, List, Any, Optional
 
@@ -34,12 +35,22 @@ async def initialize_agentic_system(project_root: str, logger: Logger = None, pr
     """
     global _agentic_system
     
+    # Reuse the running system for the same project instead of opening another
+    # ChromaDB client, embedding model and LSP indexer
+    if _is_initialized_for(project_root, lsp_client):
+        return _agentic_system
+    
     if logger is None:
         logger = Logger(name="k2edit")
     
     if progress_callback:
         await progress_callback("Initializing agentic system...")
     
+    # A system for another project or LSP client is being replaced: flush its
+    # queued writes and release its writer task and cache connection first
+    if _agentic_system is not None:
+        await _close_stores(_agentic_system)
+    
     # Initialize context manager with optional lsp_client
     _agentic_system = AgenticContextManager(logger=logger, lsp_client=lsp_client)
     await _agentic_system.initialize(project_root, progress_callback)
@@ -50,6 +61,15 @@ async def initialize_agentic_system(project_root: str, logger: Logger = None, pr
     return _agentic_system
 
 
+def _is_initialized_for(project_root: str, lsp_client=None) -> bool:
+    """Whether the global system is already initialized for this project and LSP client"""
+    if _agentic_system is None or _agentic_system.current_context is None:
+        return False
+    if lsp_client is not None and _agentic_system.lsp_indexer.lsp_client is not lsp_client:
+        return False
+    return str(_agentic_system.current_context.project_root) == str(project_root)
+
+
 async def get_agent_context() -> Optional[AgenticContextManager]:
     """Get the global agentic system instance"""
     return _agentic_system
@@ -116,11 +136,13 @@ async def get_code_intelligence(file_path: str) -> Dict[str, Any]:
     # Wait for indexing to complete before getting intelligence
     await _agentic_system.lsp_indexer.wait_for_indexing_complete()
         
-    context = await _agentic_system.get_enhanced_context("code_intelligence")
-    
-    # Get symbols for specific file
-    symbols = await _agentic_system.lsp_indexer.get_symbols(file_path)
-    dependencies = await _agentic_system.lsp_indexer.get_dependencies(file_path)
+    # The enhanced-context refresh and the per-file symbol/dependency lookups are
+    # independent; run them concurrently
+    _, symbols, dependencies = await asyncio.gather(
+        _agentic_system.get_enhanced_context("code_intelligence"),
+        _agentic_system.lsp_indexer.get_symbols(file_path),
+        _agentic_system.lsp_indexer.get_dependencies(file_path),
+    )
     
     return {
         "symbols": symbols,
@@ -157,9 +179,18 @@ async def shutdown_agentic_system():
     if _agentic_system:
         if hasattr(_agentic_system, 'lsp_indexer'):
             await _agentic_system.lsp_indexer.shutdown()
+        await _close_stores(_agentic_system)
         _agentic_system = None
 
 
+async def _close_stores(system):
+    """Flush and close a system's memory store and embedding cache"""
+    if hasattr(system, 'memory_store'):
+        await system.memory_store.close()
+    if getattr(system, 'embedding_cache', None) is not None:
+        await asyncio.to_thread(system.embedding_cache.close)
+
+
 # Configuration
 DEFAULT_AGENT_CONFIG = {
     "memory_retention_days": 30,
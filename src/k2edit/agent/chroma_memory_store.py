@@ -8,19 +8,40 @@ import json
 import hashlib
 import uuid
 import re
+import time
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
 from functools import partial
 import multiprocessing as mp
 
-import chromadb
-from chromadb.config import Settings
 from aiologger import Logger
 import aiofiles
 
-from ..utils.async_performance_utils import get_thread_pool
+from ..utils.async_performance_utils import AsyncRWLock, get_thread_pool
+from .memory_config import get_client
+
+# Values JSON cannot represent (Path, set, ...) are stored as their str() so one odd
+# field in a context dict does not fail the whole batched write
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson not available, use compact stdlib JSON (no key/item spaces, no \uXXXX escaping)
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    _json_loads = json.loads
+
+
+# Pattern IDs persist this hash, so it must not depend on an optional package;
+# blake2b is in the stdlib and still much faster than md5
+def _fast_hexdigest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 def _process_search_results_chunk(results_chunk: List[Tuple], max_distance: float, 
@@ -33,7 +54,7 @@ def _process_search_results_chunk(results_chunk: List[Tuple], max_distance: floa
             continue
             
         try:
-            content = json.loads(document)
+            content = _json_loads(document)
         except (json.JSONDecodeError, TypeError):
             continue
         
@@ -63,6 +84,10 @@ LOW_QUALITY_PATTERNS = [
     re.compile(r'\btmp\d*\b', re.IGNORECASE),
 ]
 
+def _epoch_millis() -> int:
+    """Current time as integer epoch milliseconds (cheap to compare in metadata filters)."""
+    return time.time_ns() // 1_000_000
+
 def _extract_content_string(content: Any) -> str:
     """Extract string content from various content formats."""
     if isinstance(content, dict):
@@ -98,7 +123,7 @@ class MemoryEntry:
     id: str
     type: str  # 'conversation', 'context', 'pattern', 'change'
     content: Dict[str, Any]
-    timestamp: str
+    timestamp: int  # epoch milliseconds
     file_path: Optional[str] = None
     tags: List[str] = field(default_factory=list)
 
@@ -112,12 +137,29 @@ class ChromaMemoryStore:
         "relationships": "Context relationships between memory items"
     }
     
-    def __init__(self, context_manager, logger: Logger):
+    # Embeddings are L2-normalized at generation time, so cosine search reduces to an
+    # inner product. Distances are reported on the squared-L2 scale (2 * cosine
+    # distance for unit vectors) that the max_distance thresholds were tuned against.
+    COLLECTION_SPACE = "cosine"
+    
+    # Background writer tuning: batch up to WRITE_BATCH_SIZE entries or WRITE_BATCH_INTERVAL seconds
+    WRITE_QUEUE_MAXSIZE = 1024
+    WRITE_BATCH_SIZE = 64
+    WRITE_BATCH_INTERVAL = 0.1
+    EXPORT_PAGE_SIZE = 500
+    
+    def __init__(self, context_manager, logger: Logger, config=None):
         self.logger = logger
+        self.config = config
         self.client = None
+        self._async_client = False
         self.project_root = None
         self.context_manager = context_manager
         self.collections = {}
+        self._distance_scale: Dict[str, float] = {}
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._rw_lock: Optional[AsyncRWLock] = None
         
     async def initialize(self, project_root: str = None):
         """Initialize ChromaDB memory store for a project"""
@@ -125,41 +167,96 @@ class ChromaMemoryStore:
             project_root = "."
         self.project_root = Path(project_root)
         
-        # Create .k2edit directory if it doesn't exist
-        chroma_path = self.project_root / ".k2edit" / "chroma_db"
-        chroma_path.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize ChromaDB client in a background thread to avoid blocking
-        self.client = await asyncio.to_thread(
-            chromadb.PersistentClient, 
-            path=str(chroma_path),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-                is_persistent=True
+        # Deferred import: chromadb is heavy and only needed once a store is initialized
+        import chromadb
+        from chromadb.config import Settings
+        
+        if self.config is not None and self.config.async_mode and self.config.chroma_host:
+            # A ChromaDB server has a native asyncio client: collection calls are awaited
+            # directly instead of being handed to worker threads
+            chroma_path = f"{self.config.chroma_host}:{self.config.chroma_port or 8000}"
+            self.client = await chromadb.AsyncHttpClient(
+                host=self.config.chroma_host,
+                port=self.config.chroma_port or 8000,
+                settings=Settings(**(self.config.chroma_settings or {"anonymized_telemetry": False}))
             )
-        )
+            self._async_client = True
+        else:
+            # Create .k2edit directory if it doesn't exist
+            chroma_path = self.project_root / ".k2edit" / "chroma_db"
+            chroma_path.mkdir(parents=True, exist_ok=True)
+            
+            # Reuse the process-wide client for this directory; creating one runs in a
+            # background thread to avoid blocking
+            self.client = await asyncio.to_thread(get_client, str(chroma_path))
         
         # Initialize collections
         await self._init_collections()
         
+        # The local ChromaDB writer is not safe for concurrent use: writes are exclusive,
+        # while searches share the lock and run in parallel threads
+        self._rw_lock = AsyncRWLock()
+        
+        # Start background writer so memory stores don't block callers on embedding generation
+        self._write_queue = asyncio.Queue(maxsize=self.WRITE_QUEUE_MAXSIZE)
+        self._writer_task = asyncio.create_task(self._drain_write_queue())
+        
         await self.logger.info(f"ChromaDB memory store initialized at {chroma_path}")
         
+    async def flush(self):
+        """Wait until all queued memory writes have been attempted.
+        
+        Failures are reported on each entry's future (see _store_memory), not here.
+        """
+        if self._write_queue is not None and self._writer_task is not None and not self._writer_task.done():
+            await self._write_queue.join()
+            
+    async def close(self):
+        """Flush pending writes and stop the background writer"""
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+            self._writer_task = None
+        
     async def _init_collections(self):
         """Initialize ChromaDB collections for different data types"""
         for name, description in self.COLLECTION_CONFIGS.items():
             try:
-                collection = await asyncio.to_thread(
+                collection = await self._call(
                     self.client.get_or_create_collection,
                     name=name,
-                    metadata={"description": description}
+                    metadata={"description": description, "hnsw:space": self.COLLECTION_SPACE}
                 )
                 self.collections[name] = collection
+                # Collections created before the space was set keep ChromaDB's default "l2"
+                space = (collection.metadata or {}).get("hnsw:space", "l2")
+                self._distance_scale[name] = 1.0 if space == "l2" else 2.0
                 await self.logger.debug(f"Initialized collection: {name}")
             except Exception as e:
                 await self.logger.error(f"Failed to initialize collection {name}: {e}")
                 raise
                 
+    async def _call(self, method, **kwargs):
+        """Run a ChromaDB collection call without blocking the event loop"""
+        if self._async_client:
+            return await method(**kwargs)
+        return await asyncio.to_thread(method, **kwargs)
+                
+    async def _read(self, method, **kwargs):
+        """Run a ChromaDB read, concurrently with other reads but never alongside a write"""
+        if self._rw_lock is None or self._async_client:
+            return await self._call(method, **kwargs)
+        async with self._rw_lock.reader:
+            return await self._call(method, **kwargs)
+                
+    async def _write(self, method, **kwargs):
+        """Run a ChromaDB write, one writer at a time against the local store"""
+        if self._rw_lock is None or self._async_client:
+            return await self._call(method, **kwargs)
+        async with self._rw_lock.writer:
+            return await self._call(method, **kwargs)
+                
     def _create_memory_entry(self, entry_type: str, content: Dict[str, Any], 
                            file_path: Optional[str] = None, tags: Optional[List[str]] = None,
                            prefix: Optional[str] = None) -> MemoryEntry:
@@ -168,65 +265,72 @@ class ChromaMemoryStore:
             id=self._generate_id(prefix),
             type=entry_type,
             content=content,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_epoch_millis(),
             file_path=file_path,
             tags=tags or []
         )
     
-    async def store_conversation(self, conversation: Dict[str, Any]):
-        """Store a conversation entry"""
+    async def store_conversation(self, conversation: Dict[str, Any]) -> asyncio.Future:
+        """Store a conversation entry; await the returned future for the write result"""
         entry = self._create_memory_entry("conversation", conversation)
-        await self._store_memory(entry)
+        return await self._store_memory(entry)
         
-    async def store_context(self, file_path: str, context: Dict[str, Any]):
-        """Store code context for a file"""
+    async def store_context(self, file_path: str, context: Dict[str, Any]) -> asyncio.Future:
+        """Store code context for a file; await the returned future for the write result"""
         tags = ["code", "context", Path(file_path).suffix]
         entry = self._create_memory_entry("context", context, file_path, tags, f"context_{file_path}")
-        await self._store_memory(entry)
+        return await self._store_memory(entry)
         
-    async def store_change(self, change: Dict[str, Any]):
-        """Store a code change"""
+    async def store_change(self, change: Dict[str, Any]) -> asyncio.Future:
+        """Store a code change; await the returned future for the write result"""
         entry = self._create_memory_entry("change", change, change.get("file_path"))
-        await self._store_memory(entry)
+        return await self._store_memory(entry)
         
     async def store_pattern(self, pattern_type: str, content: str, context: Dict[str, Any]):
         """Store a code pattern for future reference"""
         pattern_hash = self._hash_content(content)
-        entry_id = self._generate_id()
+        # Deterministic ID so existing patterns are found by primary key, not a metadata scan
+        entry_id = f"pattern_{pattern_hash}"
         
         # Check if pattern already exists
-        existing = await self._find_existing_pattern(pattern_hash)
+        existing = await self._find_existing_pattern(entry_id)
+        if existing is None:
+            # Patterns stored before IDs were hash-derived have a random ID and an md5
+            # pattern_hash; keep counting usage on that row instead of duplicating it
+            existing = await self._find_legacy_pattern(hashlib.md5(content.encode()).hexdigest())
         
         if existing:
             # Update usage count in metadata
-            await self._update_pattern_usage(existing["id"], pattern_hash)
+            await self._update_pattern_usage(existing["id"], existing["metadata"])
         else:
             # Store new pattern
             pattern_data = {
                 "pattern_hash": pattern_hash,
                 "pattern_type": pattern_type,
                 "content": content,
-                "context": json.dumps(context) if context else None,
+                "context": _json_dumps(context) if context else None,
                 "usage_count": 1,
-                "last_used": datetime.now().isoformat()
+                "last_used": _epoch_millis()
             }
             
             # Generate embedding for the pattern content
             embedding = await self._get_embedding(content)
             
-            self.collections["code_patterns"].upsert(
+            await self._write(
+                self.collections["code_patterns"].upsert,
                 ids=[entry_id],
                 documents=[content],
                 metadatas=[pattern_data],
                 embeddings=[embedding]
             )
             
-    async def _find_existing_pattern(self, pattern_hash: str) -> Optional[Dict[str, Any]]:
-        """Find existing pattern by hash"""
+    async def _find_existing_pattern(self, pattern_id: str) -> Optional[Dict[str, Any]]:
+        """Find existing pattern by its hash-derived ID"""
         try:
-            results = self.collections["code_patterns"].get(
-                where={"pattern_hash": pattern_hash},
-                limit=1
+            results = await self._read(
+                self.collections["code_patterns"].get,
+                ids=[pattern_id],
+                include=["metadatas"]
             )
             
             if results["ids"]:
@@ -239,39 +343,46 @@ class ChromaMemoryStore:
             
         return None
         
-    async def _update_pattern_usage(self, pattern_id: str, pattern_hash: str):
-        """Update pattern usage count"""
+    async def _find_legacy_pattern(self, legacy_hash: str) -> Optional[Dict[str, Any]]:
+        """Find a pattern stored under a random ID by its md5 pattern_hash metadata"""
         try:
-            # Get current metadata
-            results = self.collections["code_patterns"].get(
-                ids=[pattern_id],
-                include=["metadatas", "documents"]
+            results = await self._read(
+                self.collections["code_patterns"].get,
+                where={"pattern_hash": legacy_hash},
+                limit=1,
+                include=["metadatas"]
             )
             
             if results["ids"]:
-                metadata = results["metadatas"][0]
-                document = results["documents"][0]
-                
-                # Update usage count and last used
-                metadata["usage_count"] = metadata.get("usage_count", 0) + 1
-                metadata["last_used"] = datetime.now().isoformat()
-                
-                # Generate new embedding
-                embedding = await self._get_embedding(document)
-                
-                # Update the record
-                self.collections["code_patterns"].upsert(
-                    ids=[pattern_id],
-                    documents=[document],
-                    metadatas=[metadata],
-                    embeddings=[embedding]
-                )
+                return {
+                    "id": results["ids"][0],
+                    "metadata": results["metadatas"][0]
+                }
+        except Exception as e:
+            await self.logger.error(f"Error finding existing pattern: {e}")
+            
+        return None
+        
+    async def _update_pattern_usage(self, pattern_id: str, metadata: Dict[str, Any]):
+        """Update pattern usage count"""
+        try:
+            # Update usage count and last used
+            metadata["usage_count"] = metadata.get("usage_count", 0) + 1
+            metadata["last_used"] = _epoch_millis()
+            
+            # Metadata-only update: the stored embedding is still valid for the unchanged document
+            await self._write(
+                self.collections["code_patterns"].update,
+                ids=[pattern_id],
+                metadatas=[metadata]
+            )
                 
         except Exception as e:
             await self.logger.error(f"Error updating pattern usage: {e}")
             
     async def search_relevant_context(self, query: str, limit: int = 10, max_distance: float = 1.5) -> List[Dict[str, Any]]:
         """Search for relevant context based on query using semantic search with distance filtering"""
+        await self.flush()
         # Generate embedding for the query
         query_embedding = await self._get_embedding(query)
         if not any(query_embedding):  # Check if it's all zeros
@@ -280,7 +391,8 @@ class ChromaMemoryStore:
         
         # Search in memories collection with higher limit for filtering
         try:
-            results = self.collections["memories"].query(
+            results = await self._read(
+                self.collections["memories"].query,
                 query_embeddings=[query_embedding],
                 n_results=limit * 2,  # Get more results to allow filtering
                 where={"type": {"$in": ["conversation", "context", "pattern", "change"]}}
@@ -296,22 +408,23 @@ class ChromaMemoryStore:
         
         # Process and filter results
         try:
+            scale = self._distance_scale.get("memories", 1.0)
             relevant = []
             for i, doc_id in enumerate(results["ids"][0]):
-                distance = results["distances"][0][i]
+                distance = results["distances"][0][i] * scale
                 
                 # Apply distance-based filtering
                 if distance <= max_distance:
                     try:
-                        content = json.loads(results["documents"][0][i])
+                        content = _json_loads(results["documents"][0][i])
                     except (json.JSONDecodeError, TypeError) as e:
                         await self.logger.warning(f"Failed to parse document content for {doc_id}: {e}")
                         continue
                     
                     # Additional quality filtering
                     if not self._is_low_quality_content(content):
-                        # Content size filtering - limit to 1000 characters
-                        content_size = len(json.dumps(content))
+                        # Content size filtering - limit to 1000 characters of stored JSON
+                        content_size = len(results["documents"][0][i])
                         if content_size <= 1000:
                             relevant.append({
                                 "id": doc_id,
@@ -342,7 +455,8 @@ class ChromaMemoryStore:
         
         # Search in code_patterns collection with more results for filtering
         try:
-            results = self.collections["code_patterns"].query(
+            results = await self._read(
+                self.collections["code_patterns"].query,
                 query_embeddings=[code_embedding],
                 n_results=limit * 2  # Get more results to allow filtering
             )
@@ -357,9 +471,10 @@ class ChromaMemoryStore:
         
         # Process and filter results
         try:
+            scale = self._distance_scale.get("code_patterns", 1.0)
             similar = []
             for i, doc_id in enumerate(results["ids"][0]):
-                distance = results["distances"][0][i]
+                distance = results["distances"][0][i] * scale
                 
                 # Apply distance-based filtering
                 if distance <= max_distance:
@@ -367,7 +482,7 @@ class ChromaMemoryStore:
                     context_data = metadata.get("context")
                     if context_data:
                         try:
-                            context = json.loads(context_data)
+                            context = _json_loads(context_data)
                         except (json.JSONDecodeError, TypeError) as e:
                             await self.logger.warning(f"Failed to parse context data for {doc_id}: {e}")
                             context = {}
@@ -395,9 +510,11 @@ class ChromaMemoryStore:
             
     async def get_recent_conversations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversation history"""
+        await self.flush()
         # Query ChromaDB for conversation memories
         try:
-            results = self.collections["memories"].get(
+            results = await self._read(
+                self.collections["memories"].get,
                 where={"type": "conversation"},
                 limit=limit,
                 include=["documents", "metadatas"]
@@ -412,7 +529,7 @@ class ChromaMemoryStore:
             for i, doc_id in enumerate(results["ids"]):
                 metadata = results["metadatas"][i]
                 try:
-                    content = json.loads(results["documents"][i])
+                    content = _json_loads(results["documents"][i])
                 except (json.JSONDecodeError, TypeError) as e:
                     await self.logger.warning(f"Failed to parse conversation content for {doc_id}: {e}")
                     continue
@@ -423,8 +540,11 @@ class ChromaMemoryStore:
                     "timestamp": metadata.get("timestamp")
                 })
                 
-            # Sort by timestamp (most recent first)
-            conversations.sort(key=lambda x: x["timestamp"], reverse=True)
+            # Sort by timestamp (most recent first); legacy ISO-string rows sort last
+            conversations.sort(
+                key=lambda x: x["timestamp"] if isinstance(x["timestamp"], (int, float)) else 0,
+                reverse=True
+            )
             return conversations[:limit]
             
         except Exception as e:
@@ -433,9 +553,11 @@ class ChromaMemoryStore:
             
     async def get_file_context(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Get stored context for a specific file"""
+        await self.flush()
         # Query ChromaDB for file context
         try:
-            results = self.collections["memories"].get(
+            results = await self._read(
+                self.collections["memories"].get,
                 where={
                     "$and": [
                         {"type": "context"},
@@ -453,7 +575,7 @@ class ChromaMemoryStore:
         if results["ids"]:
             try:
                 metadata = results["metadatas"][0]
-                context_data = json.loads(results["documents"][0])
+                context_data = _json_loads(results["documents"][0])
                 return {
                     "context": context_data,
                     "timestamp": metadata.get("timestamp")
@@ -468,34 +590,111 @@ class ChromaMemoryStore:
                 
         return None
         
-    async def _store_memory(self, memory_entry: MemoryEntry):
-        """Store a memory entry in ChromaDB"""
+    async def _store_memory(self, memory_entry: MemoryEntry) -> asyncio.Future:
+        """Queue a memory entry for storage in ChromaDB.
+        
+        Returns as soon as the entry is queued. The returned future resolves once the
+        entry is persisted, or raises the error that kept this entry from being stored
+        (RuntimeError when its embedding could not be generated). Callers that do not
+        await it still get failures in the log.
+        """
+        future = asyncio.get_running_loop().create_future()
+        # Failures are logged by the writer; mark them retrieved so an unawaited
+        # future does not also warn when garbage collected
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        # Until the embedding model is loaded every queued entry would embed to zeros
+        # and be dropped; write directly instead of holding it in the queue
+        model_ready = getattr(self.context_manager, "embedding_model", None) is not None
+        if model_ready and self._writer_task is not None and not self._writer_task.done():
+            await self._write_queue.put((memory_entry, future))
+        else:
+            await self._resolve_writes([(memory_entry, future)])
+        return future
+            
+    async def _resolve_writes(self, batch: List[Tuple[MemoryEntry, asyncio.Future]]):
+        """Write a batch of entries and settle each entry's future with its own outcome"""
         try:
-            # Generate embedding for the content
-            content_str = json.dumps(memory_entry.content)
-            embedding = await self._get_embedding(content_str)
-            if not any(embedding):  # Check if it's all zeros
-                await self.logger.error("Failed to generate embedding for memory content - cannot store memory")
-                raise RuntimeError("Failed to generate embedding for memory storage")
-            
-            # Prepare metadata
-            metadata = {
-                "type": memory_entry.type,
-                "timestamp": memory_entry.timestamp,
-                "file_path": memory_entry.file_path,
-                "tags": json.dumps(memory_entry.tags) if memory_entry.tags else None,
-                "semantic_score": 1.0,
-                "access_count": 0,
-                "last_accessed": None
-            }
+            failed_ids = await self._write_memories([memory_entry for memory_entry, _ in batch])
+        except Exception as e:
+            # Already logged in _write_memories; the whole upsert failed
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for memory_entry, future in batch:
+            if future.done():
+                continue
+            if memory_entry.id in failed_ids:
+                future.set_exception(RuntimeError("Failed to generate embedding for memory storage"))
+            else:
+                future.set_result(None)
             
-            # Store in ChromaDB
-            self.collections["memories"].upsert(
-                ids=[memory_entry.id],
-                documents=[content_str],
-                metadatas=[metadata],
-                embeddings=[embedding]
+    async def _drain_write_queue(self):
+        """Background task that batches queued memory entries into ChromaDB upserts"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+            deadline = loop.time() + self.WRITE_BATCH_INTERVAL
+            # Collect entries arriving within the batch window. Polling with sleep rather
+            # than wait_for(get()): on Python 3.11 wait_for can swallow a cancellation that
+            # races a put, leaving this task running after close() or loop shutdown
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                if not self._write_queue.empty():
+                    batch.append(self._write_queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                await asyncio.sleep(min(timeout, 0.01))
+            
+            try:
+                await self._resolve_writes(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+                    
+    async def _write_memories(self, memory_entries: List[MemoryEntry]) -> set:
+        """Embed and upsert a batch of memory entries in a single ChromaDB call.
+        
+        Returns the ids of entries skipped because their embedding failed.
+        """
+        ids, documents, metadatas, embeddings = [], [], [], []
+        failed_ids = set()
+        try:
+            # Embed the whole batch in one model call
+            content_strs = [_json_dumps(memory_entry.content) for memory_entry in memory_entries]
+            batch_embeddings = await self.embed_batch(content_strs)
+            for memory_entry, content_str, embedding in zip(memory_entries, content_strs, batch_embeddings):
+                if not any(embedding):  # Check if it's all zeros
+                    await self.logger.error("Failed to generate embedding for memory content - cannot store memory")
+                    failed_ids.add(memory_entry.id)
+                    continue
+                
+                ids.append(memory_entry.id)
+                documents.append(content_str)
+                embeddings.append(embedding)
+                metadatas.append({
+                    "type": memory_entry.type,
+                    "timestamp": memory_entry.timestamp,
+                    "file_path": memory_entry.file_path,
+                    "tags": _json_dumps(memory_entry.tags) if memory_entry.tags else None,
+                    "semantic_score": 1.0,
+                    "access_count": 0,
+                    "last_accessed": None
+                })
+            
+            if not ids:
+                return failed_ids
+            
+            # Store in ChromaDB off the event loop
+            await self._write(
+                self.collections["memories"].upsert,
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings
             )
+            return failed_ids
             
         except Exception as e:
             await self.logger.error(f"Error storing memory: {e}")
@@ -513,14 +712,33 @@ class ChromaMemoryStore:
             await self.logger.error(f"Failed to generate embedding: {e}")
             return [0.0] * 384
     
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts in one model call, with zero-vector fallback.
+
+        Results are cached by the context manager, so a later store or search on
+        the same text reuses the vector instead of encoding it again.
+        """
+        if self.context_manager is None:
+            return [[0.0] * 384 for _ in texts]
+        generate_batch = getattr(self.context_manager, "_generate_embeddings", None)
+        if generate_batch is None:
+            # Context managers without batch support embed one text at a time
+            return [await self._get_embedding(text) for text in texts]
+        
+        try:
+            return await generate_batch(texts)
+        except Exception as e:
+            await self.logger.error(f"Failed to generate embeddings: {e}")
+            return [[0.0] * 384 for _ in texts]
+    
     def _generate_id(self, prefix: str = None) -> str:
         """Generate a unique ID for memory entries"""
         prefix_str = f"{prefix}_" if prefix else ""
         return f"{prefix_str}{uuid.uuid4().hex[:12]}"
         
     def _hash_content(self, content: str) -> str:
-        """Generate hash for content"""
-        return hashlib.md5(content.encode()).hexdigest()
+        """Generate a non-cryptographic identity hash for content"""
+        return _fast_hexdigest(content.encode())
 
     def _is_low_quality_content(self, content: Any) -> bool:
         """Check if content is low quality and should be filtered out"""
@@ -528,6 +746,7 @@ class ChromaMemoryStore:
     
     async def semantic_search(self, query: str, limit: int = 5, max_distance: float = 1.5) -> List[Dict[str, Any]]:
         """Perform semantic search using ChromaDB's native vector search with distance filtering"""
+        await self.flush()
         # Generate embedding for the query
         query_embedding = await self._get_embedding(query)
         if not any(query_embedding):  # Check if it's all zeros
@@ -536,7 +755,8 @@ class ChromaMemoryStore:
         
         # Search across all memories with higher limit for filtering
         try:
-            results = self.collections["memories"].query(
+            results = await self._read(
+                self.collections["memories"].query,
                 query_embeddings=[query_embedding],
                 n_results=limit * 2,  # Get more results for filtering
                 include=["documents", "metadatas", "distances"]
@@ -550,7 +770,8 @@ class ChromaMemoryStore:
             doc_ids = results["ids"][0]
             documents = results["documents"][0]
             metadatas = results["metadatas"][0]
-            distances = results["distances"][0]
+            scale = self._distance_scale.get("memories", 1.0)
+            distances = [distance * scale for distance in results["distances"][0]]
             
             # Use multiprocessing for large result sets (>30 results)
             if len(doc_ids) > 30:
@@ -582,7 +803,7 @@ class ChromaMemoryStore:
             # Apply distance-based filtering
             if distance <= max_distance:
                 try:
-                    content = json.loads(documents[i])
+                    content = _json_loads(documents[i])
                 except (json.JSONDecodeError, TypeError) as e:
                     await self.logger.warning(f"Failed to parse search result content for {doc_id}: {e}")
                     continue
@@ -594,7 +815,7 @@ class ChromaMemoryStore:
                         "content": content,
                         "metadata": metadatas[i],
                         "distance": distance,
-                        "similarity": 1.0 - distance,  # Convert distance to similarity
+                        "similarity": 1.0 - distance / 2,  # Cosine similarity of unit vectors
                         "relevance_score": max(0, 1.0 - (distance / max_distance))
                     })
         
@@ -624,30 +845,31 @@ class ChromaMemoryStore:
         process_func = partial(_process_search_results_chunk, 
                               max_distance=max_distance, quality_filter=True)
         
-        # Execute optimized processing using thread pool for CPU-bound operations
+        # Dispatch all chunks to the CPU thread pool at once instead of awaiting them one by one
         thread_pool = get_thread_pool()
-        chunk_results = []
-        for chunk in result_chunks:
-            result = await thread_pool.run_cpu_bound(process_func, chunk)
-            chunk_results.append(result)
+        chunk_results = await asyncio.gather(*(
+            thread_pool.run_cpu_bound(process_func, chunk) for chunk in result_chunks
+        ))
         
         # Flatten results from all chunks
         search_results = []
         for chunk_result in chunk_results:
             for result in chunk_result:
                 # Add similarity score for compatibility
-                result["similarity"] = 1.0 - result["distance"]
+                result["similarity"] = 1.0 - result["distance"] / 2
                 search_results.append(result)
         
         return search_results
     
     async def update_memory_score(self, memory_id: str, score_change: float):
         """Update the semantic score of a memory based on usage"""
+        await self.flush()
         # Get current record
         try:
-            results = self.collections["memories"].get(
+            results = await self._read(
+                self.collections["memories"].get,
                 ids=[memory_id],
-                include=["documents", "metadatas"]
+                include=["metadatas"]
             )
         except Exception as e:
             await self.logger.error(f"ChromaDB query failed for memory {memory_id}: {e}")
@@ -660,32 +882,24 @@ class ChromaMemoryStore:
         # Process memory record
         try:
             metadata = results["metadatas"][0]
-            document = results["documents"][0]
             
             # Update metadata
             metadata["semantic_score"] = metadata.get("semantic_score", 1.0) + score_change
             metadata["access_count"] = metadata.get("access_count", 0) + 1
-            metadata["last_accessed"] = datetime.now().isoformat()
+            metadata["last_accessed"] = _epoch_millis()
         except Exception as e:
             await self.logger.error(f"Error processing memory metadata for {memory_id}: {e}")
             return
         
-        # Generate new embedding
-        embedding = await self._get_embedding(document)
-        if not any(embedding):  # Check if it's all zeros
-            await self.logger.error(f"Failed to generate embedding for memory {memory_id} - cannot update")
-            return
-        
-        # Update the record
+        # Metadata-only update: the embedding computed at insert time is still valid
         try:
-            self.collections["memories"].upsert(
+            await self._write(
+                self.collections["memories"].update,
                 ids=[memory_id],
-                documents=[document],
-                metadatas=[metadata],
-                embeddings=[embedding]
+                metadatas=[metadata]
             )
         except Exception as e:
-            await self.logger.error(f"ChromaDB upsert failed for memory {memory_id}: {e}")
+            await self.logger.error(f"ChromaDB update failed for memory {memory_id}: {e}")
     
     async def add_context_relationship(self, source_id: str, target_id: str, relationship_type: str, weight: float = 1.0, metadata: Dict[str, Any] = None):
         """Add a relationship between two context items"""
@@ -698,8 +912,8 @@ class ChromaMemoryStore:
                 "target_id": target_id,
                 "relationship_type": relationship_type,
                 "weight": weight,
-                "timestamp": datetime.now().isoformat(),
-                "metadata": json.dumps(metadata) if metadata else None
+                "timestamp": _epoch_millis(),
+                "metadata": _json_dumps(metadata) if metadata else None
             }
             
             # Create a document for the relationship
@@ -716,7 +930,8 @@ class ChromaMemoryStore:
         
         # Store the relationship
         try:
-            self.collections["relationships"].upsert(
+            await self._write(
+                self.collections["relationships"].upsert,
                 ids=[relationship_id],
                 documents=[relationship_doc],
                 metadatas=[relationship_data],
@@ -727,33 +942,43 @@ class ChromaMemoryStore:
     
     async def get_related_context(self, memory_id: str, relationship_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Get related context items based on relationships"""
+        await self.flush()
         try:
+            # ChromaDB only accepts one field per where clause; combine filters with $and
             where_clause = {"source_id": memory_id}
             if relationship_type:
-                where_clause["relationship_type"] = relationship_type
+                where_clause = {"$and": [where_clause, {"relationship_type": relationship_type}]}
                 
-            results = self.collections["relationships"].get(
+            results = await self._read(
+                self.collections["relationships"].get,
                 where=where_clause,
                 limit=limit,
+                include=["metadatas"]
+            )
+            
+            if not results["ids"]:
+                return []
+            
+            # Fetch all target memories in one call instead of one get() per edge
+            target_ids = list(dict.fromkeys(metadata["target_id"] for metadata in results["metadatas"]))
+            target_results = await self._read(
+                self.collections["memories"].get,
+                ids=target_ids,
                 include=["documents", "metadatas"]
             )
+            targets = {
+                target_id: (target_results["documents"][i], target_results["metadatas"][i])
+                for i, target_id in enumerate(target_results["ids"])
+            }
             
             related = []
-            for i, rel_id in enumerate(results["ids"]):
-                metadata = results["metadatas"][i]
+            for metadata in results["metadatas"]:
                 target_id = metadata["target_id"]
-                
-                # Get the target memory
-                target_results = self.collections["memories"].get(
-                    ids=[target_id],
-                    include=["documents", "metadatas"]
-                )
-                
-                if target_results["ids"]:
-                    target_metadata = target_results["metadatas"][0]
+                if target_id in targets:
+                    document, target_metadata = targets[target_id]
                     related.append({
                         "id": target_id,
-                        "content": json.loads(target_results["documents"][0]),
+                        "content": _json_loads(document),
                         "timestamp": target_metadata.get("timestamp"),
                         "type": target_metadata.get("type"),
                         "relationship_type": metadata["relationship_type"],
@@ -771,24 +996,36 @@ class ChromaMemoryStore:
     
     async def cleanup_old_memories(self, days: int = 30):
         """Clean up memories older than specified days with semantic scoring consideration"""
+        await self.flush()
         try:
-            cutoff_timestamp = datetime.now().timestamp() - (days * 24 * 60 * 60)
-            cutoff_date = datetime.fromtimestamp(cutoff_timestamp).isoformat()
+            # Timestamps are integer epoch millis, so the cutoff is a plain numeric compare
+            cutoff_ms = _epoch_millis() - days * 86_400_000
             
             # Get old memories with low scores
-            results = self.collections["memories"].get(
+            results = await self._read(
+                self.collections["memories"].get,
                 where={
                     "$and": [
-                        {"timestamp": {"$lt": cutoff_date}},
+                        {"timestamp": {"$lt": cutoff_ms}},
                         {"semantic_score": {"$lt": 0.5}}
                     ]
                 },
-                include=["metadatas"]
+                include=[]  # IDs only
             )
             
             if results["ids"]:
                 # Delete old, low-scoring memories
-                self.collections["memories"].delete(ids=results["ids"])
+                await self._write(self.collections["memories"].delete, ids=results["ids"])
+                # Prune relationships that now point at deleted memories so the edge set doesn't grow stale
+                await self._write(
+                    self.collections["relationships"].delete,
+                    where={
+                        "$or": [
+                            {"source_id": {"$in": results["ids"]}},
+                            {"target_id": {"$in": results["ids"]}}
+                        ]
+                    }
+                )
                 if self.logger:
                     await self.logger.info(f"Cleaned up {len(results['ids'])} old memories")
         except Exception as e:
@@ -796,44 +1033,46 @@ class ChromaMemoryStore:
                 await self.logger.error(f"Error cleaning up old memories: {e}")
             
     async def export_memories(self, output_path: str):
-        """Export all memories to JSON file"""
+        """Export all memories to JSON file, streaming one page of rows at a time"""
+        await self.flush()
         try:
-            export_data = {
-                "memories": [],
-                "code_patterns": [],
-                "relationships": []
-            }
-            
-            # Export memories
-            memories = self.collections["memories"].get(include=["documents", "metadatas"])
-            for i, memory_id in enumerate(memories["ids"]):
-                export_data["memories"].append({
-                    "id": memory_id,
-                    "content": json.loads(memories["documents"][i]),
-                    "metadata": memories["metadatas"][i]
-                })
-            
-            # Export code patterns
-            patterns = self.collections["code_patterns"].get(include=["documents", "metadatas"])
-            for i, pattern_id in enumerate(patterns["ids"]):
-                export_data["code_patterns"].append({
-                    "id": pattern_id,
-                    "content": patterns["documents"][i],
-                    "metadata": patterns["metadatas"][i]
-                })
-            
-            # Export relationships
-            relationships = self.collections["relationships"].get(include=["documents", "metadatas"])
-            for i, rel_id in enumerate(relationships["ids"]):
-                export_data["relationships"].append({
-                    "id": rel_id,
-                    "content": relationships["documents"][i],
-                    "metadata": relationships["metadatas"][i]
-                })
-            
-            async with aiofiles.open(output_path, 'w') as f:
-                await f.write(json.dumps(export_data, indent=2, default=str))
+            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
+                await f.write('{"memories":[')
+                # Memory documents are already JSON, so they are written through without re-decoding
+                await self._export_collection(f, "memories", documents_are_json=True)
+                await f.write('],"code_patterns":[')
+                await self._export_collection(f, "code_patterns")
+                await f.write('],"relationships":[')
+                await self._export_collection(f, "relationships")
+                await f.write(']}')
                 
             await self.logger.info(f"Exported memories to {output_path}")
         except Exception as e:
-            await self.logger.error(f"Error exporting memories: {e}")
\ No newline at end of file
+            await self.logger.error(f"Error exporting memories: {e}")
+            
+    async def _export_collection(self, f, name: str, documents_are_json: bool = False):
+        """Write a collection's rows as comma-separated JSON objects, paging through ChromaDB"""
+        offset = 0
+        while True:
+            page = await self._read(
+                self.collections[name].get,
+                include=["documents", "metadatas"],
+                limit=self.EXPORT_PAGE_SIZE,
+                offset=offset
+            )
+            if not page["ids"]:
+                break
+            
+            rows = []
+            for i, item_id in enumerate(page["ids"]):
+                document = page["documents"][i]
+                content = document if documents_are_json else _json_dumps(document)
+                rows.append(
+                    f'{{"id":{_json_dumps(item_id)},"content":{content},'
+                    f'"metadata":{_json_dumps(page["metadatas"][i])}}}'
+                )
+            await f.write(("," if offset else "") + ",".join(rows))
+            
+            offset += len(page["ids"])
+            if len(page["ids"]) < self.EXPORT_PAGE_SIZE:
+                break
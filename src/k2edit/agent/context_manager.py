@@ -7,16 +7,17 @@ import os
 import multiprocessing
 import json
 import difflib
+import sqlite3
 import threading
 import time
 import asyncio
 import aiofiles
 from aiologger import Logger
 from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
 
 if os.name == 'posix':
     try:
@@ -33,9 +34,10 @@ from ..utils.async_performance_utils import (
 )
 
 from .memory_config import create_memory_store
+from .embedding_cache import EmbeddingCache
 from .lsp_indexer import LSPIndexer
 from .language_configs import LanguageConfigs
-from ..utils.language_utils import detect_language_from_filename, detect_project_language, detect_language_by_extension
+from ..utils.language_utils import detect_language_from_filename, detect_project_language
 
 
 @dataclass
@@ -54,6 +56,15 @@ class AgentContext:
 class AgenticContextManager:
     """Manages AI agent context, memory, and LSP integration"""
     
+    # Recently embedded texts kept in-process, so repeated queries skip the encode entirely
+    EMBEDDING_LRU_SIZE = 1024
+    # SentenceTransformer model used for embeddings and its vector size; both key
+    # the persistent embedding cache
+    EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+    EMBEDDING_DIM = 384
+    # Only this much of a file added via add_context_file is kept, as a preview
+    CONTEXT_PREVIEW_CHARS = 200
+    
     def __init__(self, logger: Logger, lsp_client=None):
         self.logger = logger
         self.memory_store = create_memory_store(self, self.logger)
@@ -62,6 +73,8 @@ class AgenticContextManager:
         self.conversation_history: List[Dict[str, Any]] = []
         self.embedding_model = None
         self._embedding_lock = None
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        self._embedding_lru: "OrderedDict[str, List[float]]" = OrderedDict()
         
         # Performance monitoring
         self.performance_monitor = get_performance_monitor(logger)
@@ -78,6 +91,9 @@ class AgenticContextManager:
         # Initialize memory store
         await self.memory_store.initialize(project_root)
         
+        # Reuse embeddings computed in earlier sessions for unchanged content
+        await self._open_embedding_cache(project_root)
+        
         # Start embedding model loading in background (non-blocking)
         asyncio.create_task(self._initialize_embedding_model_background(progress_callback))
         
@@ -138,25 +154,18 @@ class AgenticContextManager:
 
     async def add_context_file(self, file_path: str, file_content: str = None):
         """Add a file to the conversation context without changing current context"""
+        preview_chars = self.CONTEXT_PREVIEW_CHARS
         if not file_content:
-            file_content = await self._read_file_safely(file_path)
+            # Only the preview is stored, so read just past it rather than the whole file
+            file_content = await self._read_file_safely(file_path, preview_chars + 1)
             if file_content is None:
                 return False
         
-        # Store the file as additional context
-        context_entry = {
-            "type": "additional_file",
-            "file_path": file_path,
-            "content": file_content,
-            "language": detect_language_from_filename(file_path),
-            "timestamp": datetime.now().isoformat()
-        }
-        
         # Store in memory store
         await self.memory_store.store_conversation({
             "type": "context_addition",
             "file_path": file_path,
-            "content_preview": file_content[:200] + "..." if len(file_content) > 200 else file_content,
+            "content_preview": file_content[:preview_chars] + "..." if len(file_content) > preview_chars else file_content,
             "timestamp": datetime.now().isoformat()
         })
         
@@ -169,11 +178,11 @@ class AgenticContextManager:
         if progress_callback:
             await progress_callback(f"Error: {message}: {error}")
     
-    async def _read_file_safely(self, file_path: str) -> Optional[str]:
-        """Safely read a file with comprehensive error handling"""
+    async def _read_file_safely(self, file_path: str, max_chars: int = -1) -> Optional[str]:
+        """Safely read a file (or its first max_chars characters) with comprehensive error handling"""
         try:
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                return await f.read()
+                return await f.read(max_chars)
         except (FileNotFoundError, PermissionError, UnicodeDecodeError, Exception) as e:
             if isinstance(e, FileNotFoundError):
                 await self.logger.error(f"File not found {file_path}: {e}")
@@ -553,66 +562,131 @@ class AgenticContextManager:
             lineterm=''
         ))
 
+    async def _open_embedding_cache(self, project_root: str):
+        """Open the project's persistent embedding cache, continuing without it on failure."""
+        cache = EmbeddingCache(
+            Path(project_root) / ".k2edit" / "emb_cache.sqlite",
+            model=self.EMBEDDING_MODEL_NAME,
+            dim=self.EMBEDDING_DIM
+        )
+        try:
+            await asyncio.to_thread(cache.open)
+        except (sqlite3.Error, OSError) as e:
+            await self.logger.warning(f"Embedding cache unavailable, embeddings will not persist: {e}")
+            return
+        self.embedding_cache = cache
+
     async def _generate_embedding(self, content: str) -> List[float]:
         """Generate semantic embedding for content using optimized SentenceTransformer."""
+        return (await self._generate_embeddings([content]))[0]
+
+    async def _generate_embeddings(self, contents: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts, encoding all cache misses in one model call."""
+        results: List[Optional[List[float]]] = [None] * len(contents)
+        misses: Dict[str, List[int]] = {}
+        for i, content in enumerate(contents):
+            cached = self._embedding_lru.get(content)
+            if cached is not None:
+                self._embedding_lru.move_to_end(content)
+                results[i] = cached
+            else:
+                misses.setdefault(content, []).append(i)
+
+        def _fill(content: str, embedding: List[float]):
+            for i in misses[content]:
+                results[i] = embedding
+
+        cache_keys: Dict[str, str] = {}
+        if misses and self.embedding_cache is not None:
+            cache_keys = {content: EmbeddingCache.key_for(content) for content in misses}
+            # One thread hop and one query for the whole batch
+            try:
+                found = await asyncio.to_thread(self.embedding_cache.get_many, list(cache_keys.values()))
+            except sqlite3.Error as e:
+                await self.logger.warning(f"Embedding cache lookup failed: {e}")
+                found = {}
+            for content, cache_key in list(cache_keys.items()):
+                cached = found.get(cache_key)
+                if cached is not None:
+                    self._remember_embedding(content, cached)
+                    _fill(content, cached)
+                    del misses[content]
+                    del cache_keys[content]
+
+        if not misses:
+            return results
+
+        texts = list(misses)
         if not self.embedding_model:
-            await self.logger.warning("Embedding model not available, returning zero vector.")
-            return [0.0] * 384  # Dimension of all-MiniLM-L6-v2 is 384
+            await self.logger.warning("Embedding model not available, returning zero vectors.")
+            for content in texts:
+                _fill(content, [0.0] * self.EMBEDDING_DIM)
+            return results
 
-        # Start performance monitoring
         self.performance_monitor.start_timer("embedding_generation")
-        
         try:
-            # Use CPU-bound task decorator for embedding generation
             @cpu_bound_task
-            def _encode_content(model, text):
-                """Encode content using the embedding model in CPU thread pool."""
+            def _encode_batch(model, batch):
+                """Encode all texts in a single forward pass in the CPU thread pool."""
                 return model.encode(
-                    text,
+                    batch,
                     convert_to_tensor=False,
                     show_progress_bar=False,
-                    batch_size=1,
+                    batch_size=32,
                     device='cpu',
                     normalize_embeddings=True,
-                    num_workers=0  # Explicitly disable multiprocessing
+                    num_workers=0
                 )
-            
-            # Use connection pool if available, otherwise fall back to direct access
+
             if self._embedding_pool:
                 model = await self._embedding_pool.acquire()
                 try:
-                    embedding = await _encode_content(model, content)
+                    embeddings = await _encode_batch(model, texts)
                 finally:
                     await self._embedding_pool.release(model)
+            elif self._embedding_lock:
+                with self._embedding_lock:
+                    embeddings = await _encode_batch(self.embedding_model, texts)
             else:
-                # Fallback to direct model access with lock
-                if self._embedding_lock:
-                    with self._embedding_lock:
-                        embedding = await _encode_content(self.embedding_model, content)
-                else:
-                    embedding = await _encode_content(self.embedding_model, content)
-            
+                embeddings = await _encode_batch(self.embedding_model, texts)
+
             # Log performance metrics
             embed_time = self.performance_monitor.end_timer("embedding_generation")
             if embed_time > 1.0:  # Log slow embeddings
-                await self.logger.debug(f"Slow embedding generation: {embed_time:.2f}s for {len(content)} chars")
-            
-            return embedding.tolist()
-            
-        except (AttributeError, ValueError, RuntimeError) as e:
-            self.performance_monitor.end_timer("embedding_generation")
-            await self.logger.error(f"Embedding generation error: {e}")
-            return [0.0] * 384
+                await self.logger.debug(f"Slow embedding generation: {embed_time:.2f}s for {len(texts)} texts")
         except Exception as e:
             self.performance_monitor.end_timer("embedding_generation")
-            await self.logger.error(f"Unexpected embedding error: {e}")
-            return [0.0] * 384
+            await self.logger.error(f"Batch embedding generation error: {e}")
+            for content in texts:
+                _fill(content, [0.0] * self.EMBEDDING_DIM)
+            return results
+
+        fresh = []
+        for content, embedding in zip(texts, embeddings):
+            embedding = embedding.tolist()
+            if content in cache_keys:
+                fresh.append((cache_keys[content], embedding))
+            self._remember_embedding(content, embedding)
+            _fill(content, embedding)
+        if fresh:
+            # One thread hop and one commit for all new vectors
+            try:
+                await asyncio.to_thread(self.embedding_cache.put_many, fresh)
+            except sqlite3.Error as e:
+                await self.logger.warning(f"Failed to persist embeddings: {e}")
+        return results
+
+    def _remember_embedding(self, content: str, embedding: List[float]):
+        """Record an embedding in the in-process LRU, evicting the least recently used entry."""
+        self._embedding_lru[content] = embedding
+        if len(self._embedding_lru) > self.EMBEDDING_LRU_SIZE:
+            self._embedding_lru.popitem(last=False)
 
 
     async def get_enhanced_context_for_file(self, file_path: str, line: int = None) -> Dict[str, Any]:
         """Get enhanced context for a file excluding LSP outline"""
         # Ensure appropriate language server is running for this file
-        language = detect_language_by_extension(Path(file_path).suffix)
+        language = detect_language_from_filename(file_path)
         if language != "unknown" and not self.lsp_indexer.lsp_client.is_server_running(language):
             config = LanguageConfigs.get_config(language)
             await self.lsp_indexer.lsp_client.start_server(language, config["command"], self.lsp_indexer.project_root)
@@ -653,11 +727,14 @@ class AgenticContextManager:
             os.environ['NUMEXPR_NUM_THREADS'] = '1'
             
             # Try local model first, then fall back to downloading from Hugging Face
-            model_path = os.path.join(os.path.dirname(__file__), '..', 'models', 'all-MiniLM-L6-v2')
+            model_path = os.path.join(os.path.dirname(__file__), '..', 'models', self.EMBEDDING_MODEL_NAME)
             
             @io_bound_task
             def _load_model():
                 """Load model in I/O thread pool to avoid blocking."""
+                # Deferred import: sentence_transformers pulls in torch, so keep it off the startup path
+                from sentence_transformers import SentenceTransformer
+                
                 if os.path.exists(model_path):
                     return SentenceTransformer(
                         model_path,
@@ -667,7 +744,7 @@ class AgenticContextManager:
                 else:
                     # Download from Hugging Face if local model doesn't exist
                     return SentenceTransformer(
-                        'sentence-transformers/all-MiniLM-L6-v2',
+                        f'sentence-transformers/{self.EMBEDDING_MODEL_NAME}',
                         device='cpu',
                         cache_folder=None
                     )
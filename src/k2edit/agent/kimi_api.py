@@ -10,12 +10,13 @@ from typing import Dict, List, Optional, Any, Callable
 from aiologger import Logger
 from openai import AsyncOpenAI
 from openai import RateLimitError, AuthenticationError, BadRequestError, APIConnectionError, OpenAIError
-from dotenv import load_dotenv
+from pathlib import Path
 
 from .schema import TOOL_SCHEMAS
+from ..utils.config import load_env_files
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from ./.env and the checkout's .env
+load_env_files()
 
 
 class KimiAPI:
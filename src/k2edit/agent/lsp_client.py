@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from enum import Enum
 import time
 from aiologger import Logger
-from ..utils.language_utils import detect_language_by_extension
+from ..utils.language_utils import detect_language_from_filename
 
 class ServerStatus(Enum):
     STOPPED = "stopped"
@@ -796,7 +796,7 @@ class LSPClient:
         """Notify LSP server about opened file with async file reading"""
         try:
             if language is None:
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
             
             if language == "unknown" or not self.is_server_running(language):
                 return
@@ -849,7 +849,7 @@ class LSPClient:
         """Notify LSP server about file content changes"""
         try:
             if language is None:
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
             
             if language == "unknown" or not self.is_server_running(language):
                 return
@@ -896,7 +896,7 @@ class LSPClient:
                 return None
 
             if language is None:
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
             
             if language == "unknown" or not self.is_server_running(language):
                 return None
@@ -945,7 +945,7 @@ class LSPClient:
                 return None
                 
             if language is None:
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
             
             if language == "unknown" or not self.is_server_running(language):
                 return None
@@ -1051,7 +1051,7 @@ class LSPClient:
         """Get document symbols for a file"""
         try:
             if language is None:
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
             
             if language == "unknown":
                 await self.logger.warning(f"Unknown language for file: {file_path}")
@@ -3,16 +3,24 @@ Uses ChromaDB as the primary memory store.
 """
 
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
 
+# One PersistentClient per persist directory, shared by every store in the process
+_CLIENT_CACHE: Dict[str, Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
 @dataclass
 class MemoryStoreConfig:
     """Configuration for ChromaDB memory store"""
     chroma_host: Optional[str] = None
     chroma_port: Optional[int] = None
     chroma_settings: Optional[dict] = None
+    # Use chromadb's asyncio HTTP client; requires chroma_host
+    async_mode: bool = False
     
     @classmethod
     def from_env(cls) -> "MemoryStoreConfig":
@@ -23,11 +31,33 @@ class MemoryStoreConfig:
             chroma_settings={
                 "anonymized_telemetry": False,
                 "allow_reset": True
-            }
+            },
+            async_mode=os.getenv("K2EDIT_CHROMA_ASYNC", "").lower() in ("1", "true", "yes")
         )
 
 
+def get_client(path: str):
+    """Return the shared ChromaDB PersistentClient for a persist directory, creating it once"""
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(path)
+        if client is None:
+            # Deferred import: chromadb is heavy and only needed once a store is initialized
+            import chromadb
+            from chromadb.config import Settings
+            
+            client = chromadb.PersistentClient(
+                path=path,
+                settings=Settings(
+                    anonymized_telemetry=False,
+                    allow_reset=True,
+                    is_persistent=True
+                )
+            )
+            _CLIENT_CACHE[path] = client
+        return client
+
+
 def create_memory_store(context_manager, logger=None, config: Optional[MemoryStoreConfig] = None):
     """Factory function to create ChromaDB memory store"""
     from .chroma_memory_store import ChromaMemoryStore
-    return ChromaMemoryStore(context_manager, logger)
\ No newline at end of file
+    return ChromaMemoryStore(context_manager, logger, config)
\ No newline at end of file
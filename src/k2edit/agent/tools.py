@@ -1,12 +1,83 @@
 """Local tool implementations for extended functionality."""
 
+import ast
+import os
 import re
-import subprocess
+import stat
+import fnmatch
+import shlex
+import shutil
+import sys
 import asyncio
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import aiofiles
 
+from ..utils.async_performance_utils import get_thread_pool
+
+
+# Regex patterns for the local (non-LSP) analyzers, compiled once at import time
+_IMPORT_RE = re.compile(r'^\s*(?:from\s+([\w.]+)\s+)?import\s+([\w.,\s*]+)')
+# One alternation for all complexity indicators; lastgroup names the matched keyword
+_COMPLEXITY_RE = re.compile(
+    r'^\s*(?:(?P<if_statements>if)\s+|(?P<for_loops>for)\s+|(?P<while_loops>while)\s+|(?P<try_blocks>try):)'
+)
+
+_SECURITY_PATTERNS = {
+    "eval_usage": re.compile(r'\beval\s*\('),
+    "exec_usage": re.compile(r'\bexec\s*\('),
+    "shell_injection": re.compile(r'os\.system\s*\(|subprocess\.[^\s]*\s*\([^)]*shell\s*=\s*True'),
+    "hardcoded_secrets": re.compile(r'(?i)(password|secret|key|token)\s*=\s*["\'][^"\']{8,}["\']'),
+    "sql_injection": re.compile(r'["\']\s*\+\s*\w+\s*\+\s*["\']|%s.*%\s*\('),
+}
+
+# Sort key for list_files entries
+_BY_NAME = itemgetter("name")
+
+# Characters that make a list_files pattern a glob rather than a literal name
+_GLOB_MAGIC_RE = re.compile(r'[*?\[]')
+
+# Suffixes search_code never scans (compiled objects, archives, images, ...)
+_BINARY_SUFFIXES = frozenset({
+    '.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe', '.o', '.a',
+    '.zip', '.tar', '.gz', '.png', '.jpg', '.pdf',
+})
+
+# Leading bytes search_code inspects for a NUL byte before treating a file as text
+_BINARY_SNIFF_SIZE = 4096
+
+# Substrings that block run_command, matched case-insensitively in one scan of the command
+_DANGEROUS_COMMANDS = ('rm -rf', 'sudo', 'chmod 777', 'dd if=', 'mkfs', 'fdisk')
+_DANGEROUS_COMMAND_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_COMMANDS)), re.IGNORECASE)
+
+# Characters that need /bin/sh to interpret (redirection, pipes, expansion, globbing, ...)
+_SHELL_METACHARACTERS = frozenset('|&;<>()$`\\"\'*?[]{}~#=%!\n')
+
+# The same line boundaries str.splitlines() recognises
+_LINE_BREAK_RE = re.compile(r'\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+_LINE_BLOCK_SIZE = 64 * 1024
+
+
+def _iter_lines(code: str):
+    """Yield (line_number, line) like enumerate(code.splitlines(), 1) without building the whole list.
+    
+    The buffer is split in blocks of about _LINE_BLOCK_SIZE characters, each ending on a line
+    break, so the per-line work stays in str.splitlines() while memory is bounded by one block.
+    """
+    pos = 0
+    end = len(code)
+    line_number = 1
+    while pos < end:
+        block_end = pos + _LINE_BLOCK_SIZE
+        match = _LINE_BREAK_RE.search(code, block_end) if block_end < end else None
+        next_pos = match.end() if match is not None else end
+        for line in code[pos:next_pos].splitlines():
+            yield line_number, line
+            line_number += 1
+        pos = next_pos
+
+
 class ToolExecutor:
     """Executor for local tools that extend Kimi's capabilities."""
     
@@ -15,78 +86,115 @@ class ToolExecutor:
         self.current_directory = Path.cwd()
         self.logger = logger
         self.agent_integration = agent_integration
+        
+        # Tool name -> bound handler, built once so execute_tool is a single dict lookup
+        self._tools = {
+            "list_files": self.list_files,
+            "search_code": self.search_code,
+            "run_command": self.run_command,
+            "analyze_code": self.analyze_code,
+            "insert_code": self.insert_code,
+            "replace_code": self.replace_code,
+            "read_file": self.read_file,
+            "write_file": self.write_file,
+        }
 
     
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool by name with given arguments."""
-        if tool_name == "list_files":
-            return await self.list_files(**arguments)
-        elif tool_name == "search_code":
-            return await self.search_code(**arguments)
-        elif tool_name == "run_command":
-            return await self.run_command(**arguments)
-        elif tool_name == "analyze_code":
-            return await self.analyze_code(**arguments)
-        elif tool_name == "insert_code":
-            return await self.insert_code(**arguments)
-        elif tool_name == "replace_code":
-            return await self.replace_code(**arguments)
-        elif tool_name == "read_file":
-            return await self.read_file(**arguments)
-        elif tool_name == "write_file":
-            return await self.write_file(**arguments)
-        else:
+        handler = self._tools.get(tool_name)
+        if handler is None:
             return {"error": f"Unknown tool: {tool_name}"}
+        return await handler(**arguments)
     
     async def list_files(self, directory: str = ".", pattern: str = "*") -> Dict[str, Any]:
         """List files in a directory with optional pattern filtering."""
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
+            # Normalise once like pathlib would; the single-level listing below works on plain strings
+            dir_str = str(Path(directory))
+            # One stat answers both "exists" and "is a directory"
+            try:
+                dir_mode = os.stat(dir_str).st_mode
+            except FileNotFoundError:
                 return {"error": f"Directory not found: {directory}"}
             
-            if not dir_path.is_dir():
+            if not stat.S_ISDIR(dir_mode):
                 return {"error": f"Path is not a directory: {directory}"}
             
             files = []
             directories = []
             
-            if pattern:
-                # Use glob pattern
-                for item in dir_path.glob(pattern):
-                    if item.is_file():
+            if pattern and ('/' in pattern or '**' in pattern):
+                # Multi-level patterns still need pathlib's recursive glob
+                for item in Path(dir_str).glob(pattern):
+                    try:
+                        st = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    if stat.S_ISREG(st.st_mode):
                         files.append({
                             "name": item.name,
                             "path": str(item),
-                            "size": item.stat().st_size,
-                            "modified": item.stat().st_mtime
+                            "size": st.st_size,
+                            "modified": st.st_mtime
                         })
-                    elif item.is_dir():
+                    elif stat.S_ISDIR(st.st_mode):
                         directories.append({
                             "name": item.name,
                             "path": str(item)
                         })
+            elif pattern and pattern not in ('.', '..') and not _GLOB_MAGIC_RE.search(pattern):
+                # Literal name: a single stat instead of listing the directory
+                prefix = "" if dir_str == "." else os.path.join(dir_str, "")
+                try:
+                    st = os.stat(prefix + pattern)
+                except (FileNotFoundError, NotADirectoryError):
+                    st = None
+                if st is not None and stat.S_ISREG(st.st_mode):
+                    files.append({
+                        "name": pattern,
+                        "path": prefix + pattern,
+                        "size": st.st_size,
+                        "modified": st.st_mtime
+                    })
+                elif st is not None and stat.S_ISDIR(st.st_mode):
+                    directories.append({
+                        "name": pattern,
+                        "path": prefix + pattern
+                    })
             else:
-                # List all items
-                for item in dir_path.iterdir():
-                    if item.is_file():
-                        files.append({
-                            "name": item.name,
-                            "path": str(item),
-                            "size": item.stat().st_size,
-                            "modified": item.stat().st_mtime
-                        })
-                    elif item.is_dir():
-                        directories.append({
-                            "name": item.name,
-                            "path": str(item)
-                        })
+                # Single-level listing: scandir answers is_file/is_dir from d_type and stats each file once.
+                # Paths are built like pathlib's (no "./" prefix for the current directory).
+                prefix = "" if dir_str == "." else os.path.join(dir_str, "")
+                # Translate the pattern once rather than going through fnmatch's cache per entry
+                name_matches = re.compile(fnmatch.translate(pattern)).match if pattern else None
+                with os.scandir(dir_str) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name_matches is not None and not name_matches(name):
+                            continue
+                        if entry.is_file():
+                            st = entry.stat()
+                            files.append({
+                                "name": name,
+                                "path": prefix + name,
+                                "size": st.st_size,
+                                "modified": st.st_mtime
+                            })
+                        elif entry.is_dir():
+                            directories.append({
+                                "name": name,
+                                "path": prefix + name
+                            })
+            
+            files.sort(key=_BY_NAME)
+            directories.sort(key=_BY_NAME)
             
             return {
                 "success": True,
-                "directory": str(dir_path),
-                "files": sorted(files, key=lambda x: x["name"]),
-                "directories": sorted(directories, key=lambda x: x["name"]),
+                "directory": dir_str,
+                "files": files,
+                "directories": directories,
                 "total_files": len(files),
                 "total_directories": len(directories)
             }
@@ -105,45 +213,41 @@ class ToolExecutor:
             if not dir_path.exists():
                 return {"error": f"Directory not found: {directory}"}
             
-            matches = []
+            # Compile once and scan each file's whole text instead of line by line
+            compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            extensions = {ext if ext.startswith('.') else f".{ext}" for ext in file_types} if file_types else None
             
-            # Determine file search pattern
-            search_pattern = f"**/{pattern}" if pattern else "**/*"
+            # Walk the tree once (off the event loop); names come back as strings so no Path objects are built
+            thread_pool = get_thread_pool()
+            file_paths = await thread_pool.run_io_bound(self._collect_search_files, dir_path, extensions)
             
-            # Find files matching the file pattern
-            for file_path in dir_path.rglob(search_pattern):
-                if not file_path.is_file():
-                    continue
-                
-                # Skip binary files and common non-text files
-                if file_path.suffix in ['.pyc', '.pyo', '.so', '.dylib', '.dll', '.exe']:
-                    continue
-                
-                try:
-                    import aiofiles
-                    async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                        content = await f.read()
-                        lines = content.splitlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        if re.search(pattern, line, re.IGNORECASE):
-                            matches.append({
-                                "file": str(file_path),
-                                "line_number": line_num,
-                                "line_content": line.strip(),
-                                "match": pattern
-                            })
-                
-                except (UnicodeDecodeError, PermissionError):
-                    # Skip files that can't be read
-                    continue
+            # Read and scan files concurrently on the I/O pool, bounding the number in flight
+            semaphore = asyncio.Semaphore((os.cpu_count() or 4) * 4)
+            
+            async def scan(file_path: str):
+                async with semaphore:
+                    return await thread_pool.run_io_bound(self._scan_file, file_path, compiled)
+            
+            file_results = await asyncio.gather(*(scan(file_path) for file_path in file_paths))
+            
+            matches = [
+                {
+                    "file": file_path,
+                    "line_number": line_num,
+                    "line_content": line,
+                    "match": pattern
+                }
+                for file_path, file_matches in zip(file_paths, file_results)
+                for line_num, line in file_matches
+            ]
+            files_searched = len(file_paths)
             
             return {
                 "success": True,
                 "pattern": pattern,
                 "matches": matches,
                 "total_matches": len(matches),
-                "files_searched": len([f for f in dir_path.rglob("**/*") if f.is_file()])
+                "files_searched": files_searched
             }
         
         except PermissionError as e:
@@ -156,25 +260,140 @@ class ToolExecutor:
             return {"error": error_msg}
 
     
+    @classmethod
+    def _collect_search_files(cls, dir_path: Path, extensions: Optional[set]) -> List[str]:
+        """Collect the text files search_code should scan."""
+        file_paths = []
+        for file_path in cls._walk_files(dir_path):
+            suffix = os.path.splitext(file_path)[1]
+            if extensions is not None and suffix not in extensions:
+                continue
+            
+            # Skip binary files and common non-text files
+            if suffix.lower() in _BINARY_SUFFIXES:
+                continue
+            
+            file_paths.append(file_path)
+        return file_paths
+    
+    @classmethod
+    def _scan_file(cls, file_path: str, compiled: "re.Pattern[str]") -> List[tuple]:
+        """Read a file and return its matching lines; unreadable files yield no matches."""
+        try:
+            data = cls._read_text_file_bytes(file_path)
+        except (PermissionError, FileNotFoundError, IsADirectoryError):
+            return []
+        if data is None:
+            return []
+        # Match the str pattern so case folding and character classes cover non-ASCII text.
+        # Newlines are normalised like a text-mode read, so $ matches before \r\n and \r
+        text = data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+        return cls._find_matching_lines(text, compiled)
+    
+    @staticmethod
+    def _read_text_file_bytes(file_path: str) -> Optional[bytes]:
+        """Read a whole file with raw fd syscalls: one fstat, sized reads, no buffered-reader layer.
+        
+        Returns None without reading further when the first block holds a NUL byte (binary file).
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if hasattr(os, 'posix_fadvise') and size:
+                # Cold-cache hint: let the kernel read ahead the whole file
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            head = os.read(fd, _BINARY_SNIFF_SIZE)
+            if b'\x00' in head:
+                return None
+            if not head:
+                return head
+            chunks = [head]
+            remaining = size - len(head)
+            while True:
+                chunk = os.read(fd, remaining if remaining > 0 else 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _find_matching_lines(data: str, compiled: "re.Pattern[str]") -> List[tuple]:
+        """Return (line_number, stripped_line) for each line of data containing a match."""
+        results = []
+        if not data:
+            return results
+        # A trailing newline does not start another line (matches str.splitlines)
+        data_end = len(data) - 1 if data.endswith('\n') else len(data)
+        line_num = 1
+        counted_to = 0
+        pos = 0
+        while pos <= data_end:
+            match = compiled.search(data, pos)
+            if match is None or match.start() > data_end:
+                break
+            start = match.start()
+            line_num += data.count('\n', counted_to, start)
+            counted_to = start
+            line_start = data.rfind('\n', 0, start) + 1
+            line_end = data.find('\n', start)
+            if line_end == -1:
+                line_end = len(data)
+            # The whole-buffer match may span lines (e.g. \s consuming a newline); confirm within the line
+            if compiled.search(data, line_start, line_end):
+                results.append((line_num, data[line_start:line_end].strip()))
+            # One result per line, like the previous line-by-line scan
+            pos = line_end + 1
+        return results
+    
+    @staticmethod
+    def _walk_files(dir_path: Path):
+        """Yield file paths under dir_path as strings, formatted like pathlib (no "./" prefix)."""
+        root = str(dir_path)
+        pending = [("" if root == "." else os.path.join(root, ""), root)]
+        while pending:
+            prefix, scan_path = pending.pop()
+            try:
+                with os.scandir(scan_path) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            yield prefix + entry.name
+                        elif entry.is_dir(follow_symlinks=False):
+                            sub_path = prefix + entry.name
+                            pending.append((os.path.join(sub_path, ""), sub_path))
+            except (PermissionError, FileNotFoundError):
+                continue
+    
     async def run_command(self, command: str, working_directory: str = ".") -> Dict[str, Any]:
         """Execute a shell command safely."""
         try:
             # Security check - block dangerous commands
-            dangerous_commands = ['rm -rf', 'sudo', 'chmod 777', 'dd if=', 'mkfs', 'fdisk']
-            if any(dangerous in command.lower() for dangerous in dangerous_commands):
+            if _DANGEROUS_COMMAND_RE.search(command):
                 return {"error": "Command blocked for security reasons"}
             
             work_dir = Path(working_directory)
             if not work_dir.exists():
                 return {"error": f"Working directory not found: {working_directory}"}
             
-            # Execute command with timeout using async subprocess
-            process = await asyncio.create_subprocess_shell(
-                command,
-                cwd=work_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Execute command with timeout using async subprocess. Plain commands skip the
+            # intermediate /bin/sh; anything needing shell syntax or builtins still goes through it.
+            argv = self._split_plain_command(command)
+            if argv:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=work_dir,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    cwd=work_dir,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
             
             try:
                 stdout, stderr = await asyncio.wait_for(
@@ -198,9 +417,25 @@ class ToolExecutor:
                 "working_directory": str(work_dir)
             }
         
-        except subprocess.TimeoutExpired:
-            await self.logger.error("Command timed out after 30 seconds")
-            return {"error": "Command timed out after 30 seconds"}
+        except OSError as e:
+            error_msg = f"Failed to start command {command!r}: {e}"
+            await self.logger.error(error_msg)
+            return {"error": error_msg}
+    
+    @staticmethod
+    def _split_plain_command(command: str) -> Optional[List[str]]:
+        """Return argv for a command that needs no shell, or None to run it through the shell."""
+        if sys.platform == "win32" or any(c in _SHELL_METACHARACTERS for c in command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None
+        # Builtins such as cd/export have no executable and must run in the shell; so do
+        # explicit paths, which the shell resolves against the working directory
+        if not argv or os.sep in argv[0] or shutil.which(argv[0]) is None:
+            return None
+        return argv
 
     
     async def analyze_code(self, analysis_type: str, scope: str = "selection") -> Dict[str, Any]:
@@ -318,13 +553,22 @@ class ToolExecutor:
             if not self.editor:
                 return {"error": "No editor available"}
             
-            lines = self.editor.text.splitlines()
-            
-            # Insert at the specified line (1-based indexing)
-            insert_index = max(0, min(line_number - 1, len(lines)))
-            lines.insert(insert_index, code)
-            
-            self.editor.text = '\n'.join(lines)
+            document = getattr(self.editor, 'document', None)
+            if document is not None:
+                # Local edit through TextArea instead of rebuilding (and reparsing) the whole buffer
+                insert_index = max(0, line_number - 1)
+                if insert_index < document.line_count:
+                    self.editor.insert(code + '\n', location=(insert_index, 0))
+                else:
+                    self.editor.insert(('\n' if document.text else '') + code, location=document.end)
+            else:
+                lines = self.editor.text.splitlines()
+                
+                # Insert at the specified line (1-based indexing)
+                insert_index = max(0, min(line_number - 1, len(lines)))
+                lines.insert(insert_index, code)
+                
+                self.editor.text = '\n'.join(lines)
             self.editor.is_modified = True
             
             return {
@@ -394,15 +638,17 @@ class ToolExecutor:
         try:
             file_path = Path(path)
             
-            # Validate file exists
-            if not file_path.exists():
+            # Validate file exists; a single stat also gives the type and size
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
                 return {"error": f"File not found: {path}"}
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return {"error": f"Path is not a file: {path}"}
             
             # Check file size to avoid reading huge files
-            file_size = file_path.stat().st_size
+            file_size = st.st_size
             max_size = 10 * 1024 * 1024  # 10MB limit
             
             if file_size > max_size:
@@ -471,13 +717,63 @@ class ToolExecutor:
     
     async def _analyze_structure(self, code: str, file_path: str) -> Dict[str, Any]:
         """Analyze code structure (functions, classes, etc.)."""
+        # Python source gets exact results from the C parser; anything else falls back to the line scan
+        try:
+            functions, classes, imports, total_lines = self._scan_structure_ast(code)
+        except (SyntaxError, ValueError, RecursionError):
+            functions, classes, imports, total_lines = self._scan_structure_lines(code)
+        
+        return {
+            "success": True,
+            "analysis_type": "structure",
+            "file_path": file_path,
+            "lsp_based": False,
+            "total_lines": total_lines,
+            "functions": functions,
+            "classes": classes,
+            "imports": imports,
+            "summary": {
+                "function_count": len(functions),
+                "class_count": len(classes),
+                "import_count": len(imports)
+            }
+        }
+    
+    @staticmethod
+    def _scan_structure_ast(code: str) -> tuple:
+        """Collect functions, classes and imports from Python source with ast."""
+        tree = ast.parse(code)
         lines = code.splitlines()
         
+        nodes = sorted(
+            (node for node in ast.walk(tree)
+             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom))),
+            key=lambda node: (node.lineno, node.col_offset)
+        )
+        
+        functions = []
+        classes = []
+        imports = []
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                classes.append({"name": node.name, "line": node.lineno})
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.append({"statement": lines[node.lineno - 1].strip(), "line": node.lineno})
+            else:
+                functions.append({"name": node.name, "line": node.lineno})
+        
+        return functions, classes, imports, len(lines)
+    
+    @staticmethod
+    def _scan_structure_lines(code: str) -> tuple:
+        """Collect functions, classes and imports by line prefix, for code ast cannot parse."""
         functions = []
         classes = []
         imports = []
         
-        for i, line in enumerate(lines, 1):
+        total_lines = 0
+        for i, line in _iter_lines(code):
+            total_lines = i
             stripped = line.strip()
             
             if stripped.startswith('def '):
@@ -491,31 +787,15 @@ class ToolExecutor:
             elif stripped.startswith(('import ', 'from ')):
                 imports.append({"statement": stripped, "line": i})
         
-        return {
-            "success": True,
-            "analysis_type": "structure",
-            "file_path": file_path,
-            "lsp_based": False,
-            "total_lines": len(lines),
-            "functions": functions,
-            "classes": classes,
-            "imports": imports,
-            "summary": {
-                "function_count": len(functions),
-                "class_count": len(classes),
-                "import_count": len(imports)
-            }
-        }
+        return functions, classes, imports, total_lines
     
     async def _analyze_dependencies(self, code: str, file_path: str) -> Dict[str, Any]:
         """Analyze code dependencies."""
-        import_pattern = r'^\s*(?:from\s+([\w.]+)\s+)?import\s+([\w.,\s*]+)'
-        
         dependencies = set()
         imports = []
         
-        for line in code.splitlines():
-            match = re.match(import_pattern, line)
+        for _, line in _iter_lines(code):
+            match = _IMPORT_RE.match(line)
             if match:
                 module = match.group(1) or match.group(2).split(',')[0].strip()
                 dependencies.add(module.split('.')[0])  # Get root module
@@ -533,16 +813,22 @@ class ToolExecutor:
     
     async def _analyze_complexity(self, code: str, file_path: str) -> Dict[str, Any]:
         """Analyze code complexity (basic metrics)."""
-        lines = code.splitlines()
-        
-        # Count various complexity indicators
+        # Count various complexity indicators in a single pass
         complexity_indicators = {
-            "if_statements": len([l for l in lines if re.match(r'^\s*if\s+', l)]),
-            "for_loops": len([l for l in lines if re.match(r'^\s*for\s+', l)]),
-            "while_loops": len([l for l in lines if re.match(r'^\s*while\s+', l)]),
-            "try_blocks": len([l for l in lines if re.match(r'^\s*try:', l)]),
-            "nested_levels": max([len(l) - len(l.lstrip()) for l in lines if l.strip()]) // 4
+            "if_statements": 0,
+            "for_loops": 0,
+            "while_loops": 0,
+            "try_blocks": 0
         }
+        max_indent = 0
+        for _, l in _iter_lines(code):
+            match = _COMPLEXITY_RE.match(l)
+            if match:
+                complexity_indicators[match.lastgroup] += 1
+            stripped = l.lstrip()
+            if stripped:
+                max_indent = max(max_indent, len(l) - len(stripped))
+        complexity_indicators["nested_levels"] = max_indent // 4
         
         # Simple complexity score
         complexity_score = sum(complexity_indicators.values())
@@ -559,10 +845,11 @@ class ToolExecutor:
     
     async def _analyze_style(self, code: str, file_path: str) -> Dict[str, Any]:
         """Analyze code style issues."""
-        lines = code.splitlines()
         issues = []
+        # One buffer-wide scan decides whether any line can have a tab at all
+        has_tabs = '\t' in code
         
-        for i, line in enumerate(lines, 1):
+        for i, line in _iter_lines(code):
             # Check for common style issues
             if len(line) > 100:
                 issues.append({"line": i, "issue": "Line too long (>100 chars)", "severity": "warning"})
@@ -570,7 +857,7 @@ class ToolExecutor:
             if line.endswith(' '):
                 issues.append({"line": i, "issue": "Trailing whitespace", "severity": "info"})
             
-            if '\t' in line:
+            if has_tabs and '\t' in line:
                 issues.append({"line": i, "issue": "Tab character found (use spaces)", "severity": "warning"})
         
         return {
@@ -585,26 +872,21 @@ class ToolExecutor:
     
     async def _analyze_security(self, code: str, file_path: str) -> Dict[str, Any]:
         """Analyze potential security issues."""
-        security_patterns = {
-            "eval_usage": r'\beval\s*\(',
-            "exec_usage": r'\bexec\s*\(',
-            "shell_injection": r'os\.system\s*\(|subprocess\.[^\s]*\s*\([^)]*shell\s*=\s*True',
-            "hardcoded_secrets": r'(?i)(password|secret|key|token)\s*=\s*["\'][^"\']{8,}["\']',
-            "sql_injection": r'["\']\s*\+\s*\w+\s*\+\s*["\']|%s.*%\s*\(',
-        }
+        # Single pass over the lines, bucketing matches per pattern to keep the pattern-major ordering
+        issues_by_pattern = {pattern_name: [] for pattern_name in _SECURITY_PATTERNS}
         
-        issues = []
-        
-        for pattern_name, pattern in security_patterns.items():
-            for i, line in enumerate(code.splitlines(), 1):
-                if re.search(pattern, line):
-                    issues.append({
+        for i, line in _iter_lines(code):
+            for pattern_name, pattern in _SECURITY_PATTERNS.items():
+                if pattern.search(line):
+                    issues_by_pattern[pattern_name].append({
                         "line": i,
                         "issue": pattern_name.replace('_', ' ').title(),
                         "severity": "high" if pattern_name in ['eval_usage', 'exec_usage'] else "medium",
                         "line_content": line.strip()
                     })
         
+        issues = [issue for pattern_issues in issues_by_pattern.values() for issue in pattern_issues]
+        
         return {
             "success": True,
             "analysis_type": "security",
@@ -2,10 +2,14 @@
 """Custom syntax-aware text editor widget for K2Edit."""
 
 import asyncio
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union, Callable, List, Dict, Any
 
 from textual.widgets import TextArea
+from textual.widgets.text_area import LanguageDoesNotExist
+from textual._tree_sitter import get_language
 from textual.events import MouseDown, Key
 from textual.geometry import Offset
 from textual.containers import Container
@@ -13,11 +17,58 @@ from textual.widgets import ListView, ListItem, Static
 
 # Import the Nim highlight module
 from .nim_highlight import register_nim_language, is_nim_available
-from .utils.language_utils import detect_language_by_extension
+from .utils.language_utils import detect_language_from_filename
+from .utils.async_performance_utils import get_thread_pool
+
+# Resolved tree-sitter language and highlight query per language name, shared by all editors.
+# None records a language that could not be resolved so it is not retried.
+_LANGUAGE_CACHE: Dict[str, Optional[tuple]] = {}
+
+# Minimum seconds between cursor_position_changed callbacks (about one frame)
+CURSOR_NOTIFY_INTERVAL = 0.016
+
+# LSP CompletionItemKind -> icon shown in the suggestion popup
+_COMPLETION_KIND_ICONS = {
+    1: "📄", 2: "🔧", 3: "⚙️", 4: "🏗️", 5: "📋", 6: "📊", 7: "📦",
+    8: "🔗", 9: "📚", 10: "🔑", 14: "🔍", 15: "📋", 21: "🔢"
+}
+
+
+@lru_cache(maxsize=256)
+def _language_for_path(file_path: str) -> str:
+    """Language for a file path, memoized: autocomplete and go-to-definition ask on every request."""
+    if not file_path:
+        return "text"
+    
+    language = detect_language_from_filename(file_path)
+    return language if language != "unknown" else "text"
+
+
+def _write_text_file(path: Path, content: str) -> None:
+    """Create the parent directory if needed and write content as UTF-8."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
 
 class CustomSyntaxEditor(TextArea):
     """Custom syntax-aware text editor with enhanced file handling."""
     
+    # Shown when no file is loaded; shared by every editor instance
+    WELCOME_TEXT = """
+
+  ╭─────────────────────────────────────────────╮
+  │                                             │
+  │         K2Edit - Code Editor                │
+  │                                             │
+  │  Press Ctrl+O to open a file                │
+  │  Use file explorer (left) to browse         │
+  │  Press Ctrl+K for command bar               │
+  │                                             │
+  ╰─────────────────────────────────────────────╯
+
+  Ready to edit! Select a file to begin.
+"""
+    
     def __init__(self, logger, **kwargs):
         super().__init__(**kwargs)
         self.logger = logger
@@ -36,6 +87,8 @@ class CustomSyntaxEditor(TextArea):
         # Cursor position callback
         self.cursor_position_changed = None
         self._last_cursor_position = None  # Track last cursor position to prevent duplicates
+        self._last_cursor_notify = 0.0
+        self._cursor_notify_pending = False
         
         # Autocomplete support
         self._suggestion_popup = None
@@ -43,7 +96,7 @@ class CustomSyntaxEditor(TextArea):
         self._selected_suggestion_index = 0
         self._autocomplete_enabled = True
         
-        # Register Nim language with Textual (deferred to avoid async in __init__)
+        # Register Nim language with Textual (deferred until the first Nim file is loaded)
         self._nim_registration_pending = True
 
     async def _register_nim_language(self):
@@ -69,48 +122,33 @@ class CustomSyntaxEditor(TextArea):
 
     def _show_welcome_screen(self):
         """Display a welcome screen when no file is loaded."""
-        welcome_text = """
-
-  ╭─────────────────────────────────────────────╮
-  │                                             │
-  │         K2Edit - Code Editor                │
-  │                                             │
-  │  Press Ctrl+O to open a file                │
-  │  Use file explorer (left) to browse         │
-  │  Press Ctrl+K for command bar               │
-  │                                             │
-  ╰─────────────────────────────────────────────╯
-
-  Ready to edit! Select a file to begin.
-"""
-        self.load_text(welcome_text)
-        self.language = None
+        # Drop the language first (without its watcher) so the document is built once, as plain text
+        self.set_reactive(TextArea.language, None)
+        self.load_text(self.WELCOME_TEXT)
         self.read_only = True
 
     async def _create_new_file(self, path: Path) -> bool:
         """Create a new file buffer."""
+        # Try to set language and load content with fallback to plain text if parsing fails
+        language = detect_language_from_filename(path)
+        await self._set_content_with_language("", language, path)
+        
         self.current_file = path
         self.is_modified = False
         self.read_only = False
         
-        # Try to set language and load content with fallback to plain text if parsing fails
-        language = detect_language_by_extension(path.suffix.lower())
-        await self._set_content_with_language("", language)
-        
         await self.logger.info(f"CUSTOM EDITOR: Created new file buffer for: {path}")
         return True
 
     async def _load_existing_file(self, path: Path) -> bool:
         """Load content from an existing file."""
-        import aiofiles
-        async with aiofiles.open(path, 'r', encoding='utf-8') as f:
-            content = await f.read()
+        # One hop to the I/O pool for open+read+close, instead of one per aiofiles call
+        content = await get_thread_pool().run_io_bound(path.read_text, 'utf-8')
         
         # Set language based on file extension
-        extension = path.suffix.lower()
-        language = detect_language_by_extension(extension)
+        language = detect_language_from_filename(path)
         
-        await self._set_content_with_language(content, language)
+        await self._set_content_with_language(content, language, path)
         
         self.current_file = path
         self.is_modified = False
@@ -118,23 +156,57 @@ class CustomSyntaxEditor(TextArea):
         
         return True
 
-    async def _set_content_with_language(self, content: str, language: Optional[str]) -> None:
-        """Set content with language support."""
-        self.text = content
-        self.language = language if language and language != "unknown" else None
+    def _register_cached_language(self, language: str) -> None:
+        """Register a builtin language from the shared cache so its grammar and query load only once."""
+        if language in self._languages:
+            return
+        if language not in _LANGUAGE_CACHE:
+            lang_obj = get_language(language)
+            _LANGUAGE_CACHE[language] = (
+                (lang_obj, self._get_builtin_highlight_query(language)) if lang_obj is not None else None
+            )
+        cached = _LANGUAGE_CACHE[language]
+        if cached is not None:
+            self.register_language(language, *cached)
+
+    async def _set_content_with_language(self, content: str, language: Optional[str],
+                                         path: Optional[Path] = None) -> None:
+        """Set content with language support; path is the file the content belongs to."""
+        if language and language != "unknown":
+            self._register_cached_language(language)
+        else:
+            language = None
+        # Re-opening the same file with unchanged content is a no-op: skip the document rebuild,
+        # reparse and Changed message. Another file with equal text still gets a fresh document,
+        # so undo history and cursor never carry over between files.
+        if (path is not None and path == self.current_file
+                and language == self.language and self.document.text == content):
+            return
+        # Switch language without its watcher, then build and parse the document once for the new text.
+        # Assigning text and then language would parse the buffer twice, first with the stale language.
+        self.set_reactive(TextArea.language, language)
+        try:
+            self.load_text(content)
+        except LanguageDoesNotExist:
+            # Grammar not installed: show the file as plain text
+            self.set_reactive(TextArea.language, None)
+            self.load_text(content)
 
     async def load_file(self, file_path: Union[str, Path]) -> bool:
         """Load a file into the editor."""
         try:
-            # Handle deferred Nim registration if needed
-            await self._handle_deferred_registration()
-            
             path = Path(file_path)
             
-            if not path.exists():
-                return await self._create_new_file(path)
-            else:
+            # Nim highlighting (tree-sitter import + query read) is only set up once
+            # a Nim file is actually opened
+            if self._nim_registration_pending and _language_for_path(str(path)) == "nim":
+                await self._handle_deferred_registration()
+            
+            # Open directly instead of exists() + open: one syscall, and no race between the two
+            try:
                 return await self._load_existing_file(path)
+            except FileNotFoundError:
+                return await self._create_new_file(path)
             
         except Exception as e:
             await self.logger.error(f"CUSTOM EDITOR: Error loading file {file_path}: {e}", exc_info=True)
@@ -154,12 +226,7 @@ class CustomSyntaxEditor(TextArea):
 
     def _get_language_from_file(self, file_path: str) -> str:
         """Determine the programming language from file extension."""
-        if not file_path:
-            return "text"
-        
-        extension = Path(file_path).suffix.lower()
-        language = detect_language_by_extension(extension)
-        return language if language != "unknown" else "text"
+        return _language_for_path(file_path)
 
     def _get_text_position_from_mouse(self, offset: Offset) -> tuple[int, int]:
         """Convert mouse position to text position (line, character)."""
@@ -240,13 +307,8 @@ class CustomSyntaxEditor(TextArea):
                 await self.logger.error("CUSTOM EDITOR: No file path specified for saving.")
                 return False
 
-            # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write content to file asynchronously
-            import aiofiles
-            async with aiofiles.open(path, 'w', encoding='utf-8') as f:
-                await f.write(self.text)
+            # Ensure parent directory exists and write the content in a single hop to the I/O pool
+            await get_thread_pool().run_io_bound(_write_text_file, path, self.text)
 
             self.current_file = path
             self.is_modified = False
@@ -275,8 +337,8 @@ class CustomSyntaxEditor(TextArea):
             # Get the visible region of the text area
             region = self.region
             
-            # Account for line numbers and padding
-            line_number_width = len(str(len(self.text.splitlines()))) + 2 if self.show_line_numbers else 0
+            # Account for line numbers and padding; TextArea derives this from its line count
+            line_number_width = self.gutter_width
             
             # Adjust x for line numbers
             adjusted_x = x - region.x - line_number_width
@@ -288,12 +350,12 @@ class CustomSyntaxEditor(TextArea):
                 return line, char
             
             # Fallback: estimate based on visible lines and average character width
-            lines = self.text.splitlines()
-            line = max(0, min(adjusted_y, len(lines) - 1))
+            document = self.document
+            line = max(0, min(adjusted_y, document.line_count - 1))
             
             # Estimate character position based on x coordinate and font width
             estimated_char = max(0, adjusted_x // 8)  # Assume 8px per character
-            estimated_char = min(estimated_char, len(lines[line]) if line < len(lines) else 0)
+            estimated_char = min(estimated_char, len(document.get_line(line)))
             
             return line, estimated_char
             
@@ -371,6 +433,21 @@ class CustomSyntaxEditor(TextArea):
             return
             
         self._last_cursor_position = current_position
+        
+        # Notify at most once per frame; a held arrow key otherwise queues a status update per step.
+        # The trailing timer delivers the final position once movement stops.
+        elapsed = time.monotonic() - self._last_cursor_notify
+        if elapsed >= CURSOR_NOTIFY_INTERVAL:
+            self._notify_cursor_position()
+        elif not self._cursor_notify_pending:
+            self._cursor_notify_pending = True
+            self.set_timer(CURSOR_NOTIFY_INTERVAL - elapsed, self._notify_cursor_position)
+
+    def _notify_cursor_position(self) -> None:
+        """Report the latest cursor position to the cursor_position_changed callback."""
+        self._cursor_notify_pending = False
+        self._last_cursor_notify = time.monotonic()
+        line, column = self._last_cursor_position
         self.logger.debug(f"Cursor position changed: line {line}, column {column}")
         
         # Call the callback if it exists
@@ -379,16 +456,21 @@ class CustomSyntaxEditor(TextArea):
 
     async def on_key(self, event: Key) -> None:
         """Handle key events for autocomplete functionality."""
+        # Read the key and popup state once; this runs for every keystroke
+        key = event.key
+        popup = self._suggestion_popup
+        popup_visible = bool(popup and popup.display)
+        
         # Always check if popup is visible and handle navigation keys
-        if self._suggestion_popup and self._suggestion_popup.display:
+        if popup_visible:
             handled = True
-            if event.key == "escape":
+            if key == "escape":
                 self._hide_suggestions()
-            elif event.key == "up":
+            elif key == "up":
                 self._select_previous_suggestion()
-            elif event.key == "down":
+            elif key == "down":
                 self._select_next_suggestion()
-            elif event.key == "tab":
+            elif key == "tab":
                 if self._suggestions:
                     selected = self._suggestions[self._selected_suggestion_index]
                     await self._insert_completion(selected)
@@ -396,7 +478,7 @@ class CustomSyntaxEditor(TextArea):
                 else:
                     self._hide_suggestions()
                     handled = False  # Allow default tab behavior
-            elif event.key == "enter":
+            elif key == "enter":
                 if self._suggestions:
                     selected = self._suggestions[self._selected_suggestion_index]
                     await self._insert_completion(selected)
@@ -412,27 +494,29 @@ class CustomSyntaxEditor(TextArea):
                 return
         
         # Handle tab when no popup is visible
-        if event.key == "tab" and (not self._suggestion_popup or not self._suggestion_popup.display):
+        if key == "tab" and not popup_visible:
             # Default tab behavior - insert 4 spaces
             self.insert_completion("    ")
             event.prevent_default()
             event.stop()
             return
         
+        autocomplete_ready = self._autocomplete_enabled and self._lsp_client and self.current_file
+        
         # Handle Ctrl+Shift+Space for manual autocomplete trigger
-        if event.key == "ctrl+shift+space" and self._autocomplete_enabled and self._lsp_client and self.current_file:
+        if key == "ctrl+shift+space" and autocomplete_ready:
             event.prevent_default()
             event.stop()
             await self._show_suggestions()
             return
         
         # Handle character typing for triggering autocomplete
-        if event.is_printable and self._autocomplete_enabled and self._lsp_client and self.current_file:
+        if event.is_printable and autocomplete_ready:
             # Small delay to allow text to be inserted before querying
             asyncio.create_task(self._delayed_autocomplete_trigger())
         
         # Handle backspace and other editing keys
-        if event.key in ["backspace", "delete"]:
+        if key in ("backspace", "delete"):
             self._hide_suggestions()
 
     async def _delayed_autocomplete_trigger(self, delay: float = 0.15):
@@ -455,12 +539,12 @@ class CustomSyntaxEditor(TextArea):
                 return False  # Don't trigger if cursor location format is invalid
         except (ValueError, TypeError):
             return False  # Don't trigger if unpacking fails
-        lines = self.text.splitlines()
-        
-        if line >= len(lines):
+        # Read the one line from the document instead of joining and re-splitting the whole buffer
+        document = self.document
+        if line >= document.line_count:
             return False
             
-        current_line = lines[line] if line < len(lines) else ""
+        current_line = document.get_line(line)
         
         # Don't trigger on empty lines or at start of line
         if column <= 0:
@@ -559,13 +643,7 @@ class CustomSyntaxEditor(TextArea):
             display_text = label  # Use label as primary display
             
             # Add type indicator
-            type_indicator = ""
-            if kind:
-                kind_map = {
-                    1: "📄", 2: "🔧", 3: "⚙️", 4: "🏗️", 5: "📋", 6: "📊", 7: "📦",
-                    8: "🔗", 9: "📚", 10: "🔑", 14: "🔍", 15: "📋", 21: "🔢"
-                }
-                type_indicator = kind_map.get(kind, "")
+            type_indicator = _COMPLETION_KIND_ICONS.get(kind, "") if kind else ""
             
             display_text = f"{type_indicator} {label}"
             if detail and detail != label and len(detail) < 30:
@@ -612,15 +690,28 @@ class CustomSyntaxEditor(TextArea):
 
     def _select_next_suggestion(self):
         """Select the next suggestion in the list."""
-        if self._suggestions:
-            self._selected_suggestion_index = (self._selected_suggestion_index + 1) % len(self._suggestions)
-            asyncio.create_task(self._render_suggestions())
+        self._move_suggestion_selection(1)
 
     def _select_previous_suggestion(self):
         """Select the previous suggestion in the list."""
-        if self._suggestions:
-            self._selected_suggestion_index = (self._selected_suggestion_index - 1) % len(self._suggestions)
+        self._move_suggestion_selection(-1)
+
+    def _move_suggestion_selection(self, step: int):
+        """Move the highlight by toggling classes on the existing items rather than rebuilding the list."""
+        if not self._suggestions:
+            return
+        previous = self._selected_suggestion_index
+        self._selected_suggestion_index = (previous + step) % len(self._suggestions)
+        
+        if not self._suggestion_popup:
             asyncio.create_task(self._render_suggestions())
+            return
+        
+        items = self._suggestion_popup.query_one("#suggestion_list", ListView).children
+        if previous < len(items):
+            items[previous].remove_class("selected")
+        if self._selected_suggestion_index < len(items):
+            items[self._selected_suggestion_index].add_class("selected")
 
     def _hide_suggestions(self):
         """Hide the suggestion popup."""
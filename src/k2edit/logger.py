@@ -3,16 +3,157 @@
 Shared logging configuration for K2Edit application.
 """
 
+import asyncio
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Optional
+import aiofiles
 from aiologger import Logger
 from aiologger.levels import LogLevel
+from aiologger.handlers.base import Handler
 from aiologger.handlers.files import AsyncTimedRotatingFileHandler
 from aiologger.formatters.base import Formatter
+from aiologger.records import LogRecord
 
 
 # Global logger instance
 _global_logger = None
 
+# Level names accepted by setup_logging; anything else falls back to CRITICAL
+_LEVELS = {
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+    "CRITICAL": LogLevel.CRITICAL,
+}
+
+
+class K2EditLogger(Logger):
+    """aiologger Logger that also accepts printf-style positional arguments.
+    
+    aiologger records only take a single mapping for ``%(name)s`` formatting.
+    Positional arguments (``logger.info("Opened %s", path)``) are merged into the
+    message here; _log only runs for enabled levels, so disabled calls still
+    skip the formatting entirely.
+    """
+    
+    def _log(self, level, msg, args, *rest, **kwargs):
+        if args and not (len(args) == 1 and isinstance(args[0], Mapping)):
+            msg = msg % args
+            args = ()
+        return super()._log(level, msg, args, *rest, **kwargs)
+
+
+class AsyncQueueHandler(Handler):
+    """Queue in front of a slower handler, drained by a background listener task.
+    
+    emit() only enqueues the record, so an awaited log call on the UI loop never
+    waits on the target's file writes. Logger.shutdown() drains the queue and
+    closes the target.
+    """
+    
+    def __init__(self, target: Handler):
+        super().__init__()
+        self.target = target
+        self._queue: Optional[asyncio.Queue] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def initialized(self):
+        return self._listener is not None
+    
+    async def emit(self, record: LogRecord):
+        loop = asyncio.get_running_loop()
+        if self._listener is None or self._loop is not loop or self._listener.done():
+            # Started lazily: the logger is built before the app's event loop exists
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._listener = loop.create_task(self._listen(self._queue))
+        self._queue.put_nowait(record)
+    
+    async def _listen(self, queue: asyncio.Queue):
+        while True:
+            record = await queue.get()
+            try:
+                await self.target.handle(record)
+            except Exception as exc:
+                await self.handle_error(record, exc)
+            finally:
+                queue.task_done()
+    
+    async def flush(self):
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+        if self.target.initialized:
+            await self.target.flush()
+    
+    async def close(self):
+        await self.flush()
+        if self._listener is not None:
+            self._listener.cancel()
+            if self._loop is asyncio.get_running_loop():
+                await asyncio.gather(self._listener, return_exceptions=True)
+        self._listener = None
+        self._queue = None
+        self._loop = None
+        await self.target.close()
+
+
+class BufferedTimedRotatingFileHandler(AsyncTimedRotatingFileHandler):
+    """Timed rotating file handler that flushes in batches instead of per record.
+    
+    Records accumulate in a 64 KiB file buffer and are flushed every ``capacity``
+    records, immediately for records at ``flush_level`` or above, and on close.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    def __init__(self, *args, capacity: int = 512, flush_level: LogLevel = LogLevel.ERROR, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._buffered = 0
+    
+    async def _init_writer(self):
+        if not self._initialization_lock:
+            self._initialization_lock = asyncio.Lock()
+        
+        async with self._initialization_lock:
+            if not self.initialized:
+                self.stream = await aiofiles.open(
+                    file=self.absolute_file_path,
+                    mode=self.mode,
+                    encoding=self.encoding,
+                    buffering=self.BUFFER_SIZE,
+                )
+    
+    async def emit(self, record: LogRecord):
+        try:
+            if self.should_rollover(record):
+                if not self._rollover_lock:
+                    self._rollover_lock = asyncio.Lock()
+                async with self._rollover_lock:
+                    if self.should_rollover(record):
+                        # Closing the old file flushes whatever it buffered
+                        await self.do_rollover()
+                        self._buffered = 0
+            if not self.initialized:
+                await self._init_writer()
+            
+            await self.stream.write(self.formatter.format(record) + self.terminator)
+            self._buffered += 1
+            if record.levelno >= self.flush_level or self._buffered >= self.capacity:
+                await self.flush()
+        except Exception as exc:
+            await self.handle_error(record, exc)
+    
+    async def flush(self):
+        self._buffered = 0
+        if self.initialized:
+            await self.stream.flush()
+
 
 def setup_logging(log_level: str = "DEBUG") -> Logger:
     """Setup logging configuration with both file and Textual handlers.
@@ -28,30 +169,30 @@ def setup_logging(log_level: str = "DEBUG") -> Logger:
     if _global_logger is not None:
         return _global_logger
     
-    # Create logs directory in user home if it doesn't exist
+    # Create logs directory in user home if it doesn't exist; on every start after
+    # the first, a single stat replaces mkdir's failed-create-then-stat pair
     log_dir = Path.home() / "k2edit" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
     
     # Create log filename with timestamp
     log_file = log_dir / "k2edit.log"
     
-    # Configure root logger
-    logger = Logger(name="k2edit")
+    # Resolve the level once; records below it are dropped before any formatting
+    level = _LEVELS.get(log_level) or _LEVELS.get(log_level.upper(), LogLevel.CRITICAL)
     
-    # Set log level
-    level = LogLevel.DEBUG if log_level.upper() == "DEBUG" else \
-            LogLevel.INFO if log_level.upper() == "INFO" else \
-            LogLevel.WARNING if log_level.upper() == "WARNING" else \
-            LogLevel.ERROR if log_level.upper() == "ERROR" else \
-            LogLevel.CRITICAL
+    # Configure root logger
+    logger = K2EditLogger(name="k2edit", level=level)
     
-    # Create handlers
-    file_handler = AsyncTimedRotatingFileHandler(
+    # Create handlers; the file is not opened until the first record is emitted
+    file_handler = BufferedTimedRotatingFileHandler(
         filename=str(log_file),
         when='D',
         interval=1,
         backup_count=7,
-        encoding="utf-8"
+        encoding="utf-8",
+        capacity=512,
+        flush_level=LogLevel.ERROR
     )
     # console_handler = AsyncStreamHandler()
     
@@ -63,8 +204,8 @@ def setup_logging(log_level: str = "DEBUG") -> Logger:
     file_handler.formatter = formatter
     # console_handler.formatter = formatter
     
-    # Add handlers to logger
-    logger.add_handler(file_handler)
+    # Add handlers to logger; file writes happen on the queue's listener task
+    logger.add_handler(AsyncQueueHandler(file_handler))
     # logger.add_handler(console_handler)
     
     _global_logger = logger
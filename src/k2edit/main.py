@@ -6,21 +6,13 @@ A terminal-based code editor with AI integration using Textual framework.
 
 
 import os
+import stat
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 import asyncio
+from functools import lru_cache
 from typing import Dict, Any
 
-# Performance optimization: Use uvloop for better async performance on Unix systems
-try:
-    import uvloop
-    if sys.platform != "win32":
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-except ImportError:
-    # uvloop not available, continue with default event loop
-    pass
-
 from aiologger import Logger
 
 from textual.app import App, ComposeResult
@@ -46,11 +38,11 @@ from .views.search_replace_dialog import SearchReplaceDialog, FindInFilesDialog
 from .views.ai_mode_selector import AIModeSelector
 from .views.ai_model_selector import AIModelSelector
 from .utils.search_manager import SearchManager
-from .agent.kimi_api import KimiAPI
-from .agent.integration import K2EditAgentIntegration
-from .logger import setup_logging
+from .logger import K2EditLogger, setup_logging
+from .utils.path_validation import stat_mode
 from .utils import (
-    get_config
+    get_config,
+    load_env_files
 )
 from .utils.initialization import (
     create_agent_initializer,
@@ -63,6 +55,12 @@ from .utils.async_performance_utils import (
 )
 
 
+@lru_cache(maxsize=1)
+def _cwd() -> Path:
+    """Process working directory; K2Edit never changes it, so getcwd() runs once"""
+    return Path.cwd()
+
+
 class K2EditCommands(Provider):
     """Command provider for K2Edit editor features."""
     
@@ -161,7 +159,7 @@ class K2EditApp(App):
         super().__init__(**kwargs)
         
         # Setup logging and configuration
-        self.logger = logger or Logger(name="k2edit")
+        self.logger = logger or K2EditLogger(name="k2edit")
         self.config = get_config()
         
 
@@ -176,6 +174,8 @@ class K2EditApp(App):
         self.hover_widget = HoverWidget(id="hover-widget", logger=self.logger)
         self.file_path_display = FilePathDisplay(id="file-path-display")
         self.terminal_panel = TerminalPanel(id="terminal-panel", logger=self.logger)
+        # Imported here: pulls in the openai/httpx client stack
+        from .agent.kimi_api import KimiAPI
         self.kimi_api = KimiAPI(self.logger)
         self.agent_integration = None
         self.initial_file = initial_file
@@ -239,10 +239,13 @@ class K2EditApp(App):
         ) if self._task_queue else None
 
         # Load initial file if provided, otherwise start with an empty editor
+        opened = False
         if self.initial_file:
-            await self.open_path(self.initial_file)
+            # A missing startup path is reported in the output panel, not created
+            opened = await self.open_path(self.initial_file, allow_create=False)
         else:
             await self.logger.info("No initial file provided, starting with an empty editor.")
+        if not opened:
             self.file_path_display.set_file(None)
             self.editor.focus()
         
@@ -259,7 +262,7 @@ class K2EditApp(App):
             else:  # Info (3) or Log (4)
                 self.notify(message, severity="information", title=f"{language.upper()} LSP")
         except Exception as e:
-            await self.logger.error(f"Error handling show message: {e}")
+            await self.logger.error("Error handling show message: %s", e)
     
     def _determine_project_root(self) -> str:
         """Determine the project root based on initial file/directory parameter.
@@ -275,12 +278,15 @@ class K2EditApp(App):
             elif initial_path.exists():
                 # If initial file is a file, use its parent directory as project root
                 return str(initial_path.parent.resolve())
-            else:
+            elif initial_path.parent.is_dir():
                 # If initial file doesn't exist, try to use its parent directory
                 return str(initial_path.parent.resolve())
+            else:
+                # Missing parent: fall back to cwd rather than creating directories
+                return str(_cwd())
         else:
             # No initial file provided, use current working directory
-            return str(Path.cwd())
+            return str(_cwd())
     
     async def _initialize_agent_system(self):
         """Initialize the agentic system using the standardized initializer with performance monitoring."""
@@ -308,7 +314,7 @@ class K2EditApp(App):
         finally:
             # Log initialization time
             init_time = self.performance_monitor.end_timer("agent_initialization")
-            await self.logger.info(f"Agent system initialization completed in {init_time:.2f}s")
+            await self.logger.info("Agent system initialization completed in %.2fs", init_time)
         
         # Set output panel for agent integration error handling
         if self.agent_integration:
@@ -319,7 +325,7 @@ class K2EditApp(App):
             
             # Set up LSP client for go-to-definition
             if self.agent_integration.lsp_client and self.agent_integration.lsp_client.connections:
-                await self.logger.debug(f"LSP client has {len(self.agent_integration.lsp_client.connections)} active connections, setting up editor and updating status to Connected")
+                await self.logger.debug("LSP client has %s active connections, setting up editor and updating status to Connected", len(self.agent_integration.lsp_client.connections))
                 self.editor.set_lsp_client(self.agent_integration.lsp_client)
                 self.status_bar.update_language_server_status("Connected")
                 await self.logger.debug("LSP status updated to Connected")
@@ -328,11 +334,12 @@ class K2EditApp(App):
                 self.status_bar.update_language_server_status("Disconnected")
                 await self.logger.debug("LSP status updated to Disconnected")
     
-    async def open_path(self, file_path: str) -> bool:
+    async def open_path(self, file_path: str, allow_create: bool = True) -> bool:
         """Open a file or directory path, handling both scenarios appropriately.
         
         Args:
             file_path: Path to the file or directory to open
+            allow_create: Whether a non-existent path opens as a new file
             
         Returns:
             bool: True if path was successfully opened, False otherwise
@@ -349,10 +356,15 @@ class K2EditApp(App):
         # Check if path exists and determine type
         try:
             path = Path(file_path)
-            if not path.exists():
+            # Filesystem calls run off the event loop: a slow or network mount must not
+            # freeze the UI
+            mode = await asyncio.to_thread(stat_mode, path)
+            is_dir = None if mode is None else stat.S_ISDIR(mode)
+            
+            if is_dir is None:
                 # For non-existent paths, try file validation with allow_create
                 try:
-                    is_valid, error_msg = validate_file_path(file_path, allow_create=True)
+                    is_valid, error_msg = await asyncio.to_thread(validate_file_path, file_path, allow_create=allow_create)
                     if not is_valid:
                         self.output_panel.add_error(error_msg)
                         await self.logger.error(error_msg)
@@ -365,12 +377,12 @@ class K2EditApp(App):
                 return await self._open_file_internal(file_path)
             
             # Handle directory case
-            if path.is_dir():
+            if is_dir:
                 return await self.open_directory(file_path)
             
             # Handle file case - validate as file
             try:
-                is_valid, error_msg = validate_file_path(file_path, allow_create=True)
+                is_valid, error_msg = await asyncio.to_thread(validate_file_path, file_path, allow_create=True)
                 if not is_valid:
                     self.output_panel.add_error(error_msg)
                     await self.logger.error(error_msg)
@@ -424,7 +436,7 @@ class K2EditApp(App):
         
         # Validate directory path
         try:
-            is_valid, error_msg = validate_directory_path(directory_path)
+            is_valid, error_msg = await asyncio.to_thread(validate_directory_path, directory_path)
             if not is_valid:
                 self.output_panel.add_error(error_msg)
                 await self.logger.error(error_msg)
@@ -437,7 +449,7 @@ class K2EditApp(App):
         
         # Set as file explorer root
         try:
-            await self.logger.info(f"Setting directory as file explorer root: {directory_path}")
+            await self.logger.info("Setting directory as file explorer root: %s", directory_path)
             await self.file_explorer.set_root_path(Path(directory_path))
             
             # Update file path display to show directory
@@ -485,7 +497,7 @@ class K2EditApp(App):
         
         # Update UI components
         self.output_panel.add_info(f"Loaded file: {file_path}")
-        await self.logger.info(f"Successfully loaded file: {file_path}")
+        await self.logger.info("Successfully loaded file: %s", file_path)
         self.editor.focus()
         
         # Update file path display
@@ -508,31 +520,31 @@ class K2EditApp(App):
             if self.agent_integration.lsp_client:
                 from .agent.language_configs import LanguageConfigs
                 from pathlib import Path
-                from .utils.language_utils import detect_language_by_extension
+                from .utils.language_utils import detect_language_from_filename
                 
-                language = detect_language_by_extension(Path(file_path).suffix)
+                language = detect_language_from_filename(file_path)
                 if language != "unknown" and not self.agent_integration.lsp_client.is_server_running(language):
                     try:
-                        await self.logger.info(f"Starting {language} language server for file: {file_path}")
+                        await self.logger.info("Starting %s language server for file: %s", language, file_path)
                         config = LanguageConfigs.get_config(language)
                         # Start server initialization in background to avoid blocking UI
                         asyncio.create_task(self._start_language_server_async(language, config, file_path))
                         # Update LSP status immediately to show "Starting" state
                         await self._update_lsp_status()
                     except KeyError as e:
-                        await self.logger.error(f"Language server configuration not found for {language}: {e}")
+                        await self.logger.error("Language server configuration not found for %s: %s", language, e)
                         await self._update_lsp_status()
                     except FileNotFoundError:
-                        await self.logger.error(f"Language server executable not found for {language}")
+                        await self.logger.error("Language server executable not found for %s", language)
                         await self._update_lsp_status()
                     except ConnectionError as e:
-                        await self.logger.error(f"Failed to connect to {language} language server: {e}")
+                        await self.logger.error("Failed to connect to %s language server: %s", language, e)
                         await self._update_lsp_status()
                     except TimeoutError:
-                        await self.logger.error(f"Timeout starting {language} language server")
+                        await self.logger.error("Timeout starting %s language server", language)
                         await self._update_lsp_status()
                     except Exception as e:
-                        await self.logger.error(f"Unexpected error starting {language} language server: {e}", exc_info=True)
+                        await self.logger.error("Unexpected error starting %s language server: %s", language, e, exc_info=True)
                         await self._update_lsp_status()
             
             # Notify LSP server about the opened file
@@ -554,14 +566,14 @@ class K2EditApp(App):
                 )
                 
                 if init_success:
-                    await self.logger.info(f"Started {language} language server successfully")
+                    await self.logger.info("Started %s language server successfully", language)
                 else:
-                    await self.logger.error(f"Failed to initialize {language} language server connection")
+                    await self.logger.error("Failed to initialize %s language server connection", language)
             else:
-                await self.logger.error(f"Failed to start {language} language server")
+                await self.logger.error("Failed to start %s language server", language)
                 
         except Exception as e:
-            await self.logger.error(f"Error in background language server startup for {language}: {e}", exc_info=True)
+            await self.logger.error("Error in background language server startup for %s: %s", language, e, exc_info=True)
         finally:
             # Always update LSP status after completion
             await self._update_lsp_status()
@@ -582,7 +594,7 @@ class K2EditApp(App):
         
         if active_connections:
             status = f"Connected ({', '.join(active_connections)})"
-            await self.logger.debug(f"Updating LSP status to {status}")
+            await self.logger.debug("Updating LSP status to %s", status)
             self.status_bar.update_language_server_status("Connected")
         else:
             await self.logger.debug("Updating LSP status to Disconnected - no active connections")
@@ -602,14 +614,14 @@ class K2EditApp(App):
     async def _on_diagnostics_received(self, file_path: str, diagnostics: list):
         """Callback for when new diagnostics are received from LSP server"""
         if not diagnostics or not isinstance(diagnostics, list):
-            await self.logger.debug(f"Invalid or empty diagnostics for {file_path}")
+            await self.logger.debug("Invalid or empty diagnostics for %s", file_path)
             return
             
         try:
-            await self.logger.debug(f"Diagnostics callback triggered for {file_path}: {len(diagnostics)} items")
+            await self.logger.debug("Diagnostics callback triggered for %s: %s items", file_path, len(diagnostics))
             
             # Always update status bar with diagnostics, regardless of current file
-            await self.logger.debug(f"Updating status bar with diagnostics for: {file_path}")
+            await self.logger.debug("Updating status bar with diagnostics for: %s", file_path)
             # Format diagnostics data correctly for status bar
             diagnostics_data = {
                 'diagnostics': diagnostics,
@@ -618,17 +630,17 @@ class K2EditApp(App):
             await self.status_bar.update_diagnostics_from_lsp(diagnostics_data)
             
             if self.editor.current_file and str(self.editor.current_file) == file_path:
-                await self.logger.debug(f"Diagnostics updated for current file: {file_path}")
+                await self.logger.debug("Diagnostics updated for current file: %s", file_path)
             else:
-                await self.logger.debug(f"Diagnostics updated for non-current file: {file_path}")
+                await self.logger.debug("Diagnostics updated for non-current file: %s", file_path)
         except AttributeError as e:
-            await self.logger.error(f"Status bar method not available: {e}")
+            await self.logger.error("Status bar method not available: %s", e)
             self.output_panel.add_error("Failed to update diagnostics display")
         except KeyError as e:
-            await self.logger.error(f"Missing required diagnostics data: {e}")
+            await self.logger.error("Missing required diagnostics data: %s", e)
             self.output_panel.add_error("Invalid diagnostics data format")
         except Exception as e:
-            await self.logger.error(f"Unexpected error processing diagnostics for {file_path}: {e}", exc_info=True)
+            await self.logger.error("Unexpected error processing diagnostics for %s: %s", file_path, e, exc_info=True)
             self.output_panel.add_error("Failed to process diagnostics")
 
     async def _trigger_hover_request(self, line: int, column: int):
@@ -646,10 +658,10 @@ class K2EditApp(App):
         try:
             file_path = str(self.editor.current_file)
         except AttributeError as e:
-            await self.logger.error(f"Editor current_file not available: {e}")
+            await self.logger.error("Editor current_file not available: %s", e)
             return
             
-        await self.logger.debug(f"Requesting hover for: {file_path} at ({line}, {column})")
+        await self.logger.debug("Requesting hover for: %s at (%s, %s)", file_path, line, column)
         
         # Request hover information from LSP
         try:
@@ -657,26 +669,26 @@ class K2EditApp(App):
                 file_path, line, column
             )
         except AttributeError as e:
-            await self.logger.error(f"LSP client method not available: {e}")
+            await self.logger.error("LSP client method not available: %s", e)
             return
         except ConnectionError as e:
-            await self.logger.error(f"LSP connection error during hover request: {e}")
+            await self.logger.error("LSP connection error during hover request: %s", e)
             return
         except ValueError as e:
-            await self.logger.error(f"Invalid hover request parameters: {e}")
+            await self.logger.error("Invalid hover request parameters: %s", e)
             return
             
-        await self.logger.debug(f"Hover result: {hover_result is not None}")
+        await self.logger.debug("Hover result: %s", hover_result is not None)
         
         if hover_result and "contents" in hover_result:
             # Extract markdown content
             try:
                 content = self._extract_hover_content(hover_result["contents"])
             except KeyError as e:
-                await self.logger.error(f"Missing expected data in hover response: {e}")
+                await self.logger.error("Missing expected data in hover response: %s", e)
                 return
                 
-            await self.logger.debug(f"Extracted hover content length: {len(content) if content else 0}")
+            await self.logger.debug("Extracted hover content length: %s", len(content) if content else 0)
             
             if content and content.strip():
                 self._last_hover_content = content
@@ -863,13 +875,16 @@ class K2EditApp(App):
     async def on_file_explorer_file_selected(self, message: FileExplorer.FileSelected) -> None:
         """Handle file selection from the file explorer."""
         file_path = message.file_path
-        await self.logger.info(f"File selected from explorer: {file_path}")
+        await self.logger.info("File selected from explorer: %s", file_path)
         
-        if Path(file_path).is_file():
+        # Files from the explorer's last scan need no stat; anything else is checked
+        if file_path in self.file_explorer.known_files or stat.S_ISREG(
+            await asyncio.to_thread(stat_mode, Path(file_path)) or 0
+        ):
             await self.open_path(file_path)
         else:
             # It's a directory, keep the tree view
-            await self.logger.debug(f"Directory selected: {file_path}")
+            await self.logger.debug("Directory selected: %s", file_path)
     
     async def _add_file_to_context(self, file_path: str) -> None:
         """Add file to AI agent context."""
@@ -880,22 +895,17 @@ class K2EditApp(App):
             return
         
         try:
-            # Read file content asynchronously
-            import aiofiles
-            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-            
-            # Add to agent context via integration
-            success = await self.agent_integration.add_context_file(file_path, content)
+            # The context manager reads only the part of the file it keeps
+            success = await self.agent_integration.add_context_file(file_path)
             if success:
-                await self.logger.info(f"Successfully added {file_path} to AI context")
+                await self.logger.info("Successfully added %s to AI context", file_path)
             else:
                 error_msg = "Failed to add file to context"
                 await self.logger.error(error_msg)
                 self.output_panel.add_error(error_msg)
                 
         except Exception as e:
-            await self.logger.error(f"Error adding file to context: {e}")
+            await self.logger.error("Error adding file to context: %s", e)
             self.output_panel.add_error(f"Failed to add file to context: {e}")
     
     async def action_quit(self) -> None:
@@ -908,19 +918,16 @@ class K2EditApp(App):
     
     async def action_open_file(self) -> None:
         """Focus command bar with open command."""
-        await self.logger.debug("User triggered open file action")
         self.command_bar.focus()
         self.command_bar.set_text("/open ")
     
     async def action_save_file(self) -> None:
         """Focus command bar with save command."""
-        await self.logger.debug("User triggered save file action")
         self.command_bar.focus()
         self.command_bar.set_text("/save")
     
     async def action_focus_command(self) -> None:
         """Focus the command bar."""
-        await self.logger.debug("Focusing command bar")
         self.command_bar.focus()
     
     async def action_focus_editor(self) -> None:
@@ -1001,9 +1008,9 @@ class K2EditApp(App):
         await self.logger.debug("Toggling sidebar")
         self.sidebar_visible = not self.sidebar_visible
         # Update CSS classes or visibility
+        # Toggling display refreshes the affected layout region on its own
         if hasattr(self.file_explorer, 'display'):
             self.file_explorer.display = self.sidebar_visible
-        self.refresh()
     
     async def action_toggle_fullscreen(self) -> None:
         """Toggle fullscreen mode."""
@@ -1089,12 +1096,12 @@ class K2EditApp(App):
             await self.push_screen(modal)
             await self.logger.debug("Settings modal opened successfully")
         except Exception as e:
-            await self.logger.error(f"Failed to open settings modal: {e}")
+            await self.logger.error("Failed to open settings modal: %s", e)
             self.output_panel.add_error(f"Failed to open settings: {e}")
     
     async def on_terminal_panel_toggle_visibility(self, message: TerminalPanel.ToggleVisibility) -> None:
         """Handle terminal panel visibility toggle messages."""
-        await self.logger.info(f"Terminal panel visibility changed: {message.visible}")
+        await self.logger.info("Terminal panel visibility changed: %s", message.visible)
         
         # Update layout if needed
         if message.visible:
@@ -1114,7 +1121,7 @@ class K2EditApp(App):
                         cursor_location[1] + 1
                     )
             except (ValueError, TypeError, IndexError) as e:
-                await self.logger.debug(f"Error updating cursor position in status bar: {e}")
+                await self.logger.debug("Error updating cursor position in status bar: %s", e)
             
             # Update file information
             current_file = str(self.editor.current_file) if self.editor.current_file else ""
@@ -1123,9 +1130,6 @@ class K2EditApp(App):
             
             # Update status bar with editor content and file path
             await self.status_bar.update_from_editor(editor_content, current_file)
-            
-            # Force refresh of status bar
-            self.status_bar.refresh()
     
 
     
@@ -1139,14 +1143,14 @@ class K2EditApp(App):
                 try:
                     await self.terminal_panel.cleanup()
                 except Exception as e:
-                    await self.logger.error(f"Error cleaning up terminal panel: {e}")
+                    await self.logger.error("Error cleaning up terminal panel: %s", e)
             
             # Shutdown task queue
             if self._task_queue:
                 try:
                     await self._task_queue.stop()
                 except Exception as e:
-                    await self.logger.error(f"Error shutting down task queue: {e}")
+                    await self.logger.error("Error shutting down task queue: %s", e)
             
             # Shutdown thread pool
             if hasattr(self, 'thread_pool'):
@@ -1159,14 +1163,14 @@ class K2EditApp(App):
                     except Exception:
                         pass
                 except Exception as e:
-                    await self.logger.error(f"Error shutting down thread pool: {e}")
+                    await self.logger.error("Error shutting down thread pool: %s", e)
             
             # Shutdown agentic system
             if self.agent_integration:
                 try:
                     await self.agent_integration.shutdown()
                 except Exception as e:
-                    await self.logger.error(f"Error shutting down agent integration: {e}")
+                    await self.logger.error("Error shutting down agent integration: %s", e)
             
             # Shutdown logger last, with error handling
             try:
@@ -1183,7 +1187,7 @@ class K2EditApp(App):
     async def show_diagnostics_modal(self, diagnostics: list[Dict[str, Any]]) -> None:
         """Direct method to show diagnostics modal, bypassing message system."""
         await self.logger.debug("=== SHOW_DIAGNOSTICS_MODAL CALLED DIRECTLY ===")
-        await self.logger.debug(f"Diagnostics count: {len(diagnostics)}")
+        await self.logger.debug("Diagnostics count: %s", len(diagnostics))
         
         try:
             modal = DiagnosticsModal(diagnostics, logger=self.logger)
@@ -1192,19 +1196,19 @@ class K2EditApp(App):
             await self.logger.debug("Pushed DiagnosticsModal to screen via direct method")
             await self.logger.debug("=== DIAGNOSTICS MODAL DISPLAYED VIA DIRECT CALL ===")
         except Exception as e:
-            await self.logger.error(f"Failed to show diagnostics modal via direct call: {e}")
+            await self.logger.error("Failed to show diagnostics modal via direct call: %s", e)
             import traceback
             await self.logger.error(traceback.format_exc())
 
     async def on_status_bar_git_branch_switch(self, message: GitBranchSwitch) -> None:
         """Handle git branch switch message from status bar."""
-        await self.logger.info(f"Switching to git branch: {message.branch_name}")
+        await self.logger.info("Switching to git branch: %s", message.branch_name)
         
         try:
             import subprocess
             from pathlib import Path
             
-            current_dir = Path.cwd()
+            current_dir = _cwd()
             
             # Check if we're in a git repository
             git_dir = current_dir / ".git"
@@ -1248,17 +1252,17 @@ class K2EditApp(App):
 
     async def on_navigate_to_diagnostic(self, message: NavigateToDiagnostic) -> None:
         """Handle navigate to diagnostic message."""
-        await self.logger.debug(f"Navigating to diagnostic: {message.file_path}:{message.line}:{message.column}")
+        await self.logger.debug("Navigating to diagnostic: %s:%s:%s", message.file_path, message.line, message.column)
         
         try:
             # Open the file if it's not already open
             if message.file_path != str(self.editor.current_file):
-                if self.editor.load_file(message.file_path):
+                if await self.editor.load_file(message.file_path):
                     self.output_panel.add_info(f"Opened file: {message.file_path}")
-                    await self.logger.debug(f"Successfully opened file: {message.file_path}")
+                    await self.logger.debug("Successfully opened file: %s", message.file_path)
                 else:
                     self.output_panel.add_error(f"Failed to open file: {message.file_path}")
-                    await self.logger.error(f"Failed to open file: {message.file_path}")
+                    await self.logger.error("Failed to open file: %s", message.file_path)
                     return
             
             # Navigate to the specific line and column
@@ -1268,7 +1272,7 @@ class K2EditApp(App):
             # self.editor.scroll_to_line(line_idx)
             self.editor.focus()
             
-            await self.logger.debug(f"Successfully navigated to line {message.line}, column {message.column}")
+            await self.logger.debug("Successfully navigated to line %s, column %s", message.line, message.column)
             
         except Exception as e:
             error_msg = f"Error navigating to diagnostic: {e}"
@@ -1278,7 +1282,7 @@ class K2EditApp(App):
     async def on_ai_mode_selector_mode_selected(self, message: AIModeSelector.ModeSelected) -> None:
         """Handle AI mode selection."""
         self.current_ai_mode = message.mode
-        await self.logger.info(f"AI mode changed to: {message.mode}")
+        await self.logger.info("AI mode changed to: %s", message.mode)
         
         # Update command bar with the new mode
         if hasattr(self.command_bar, 'set_ai_mode'):
@@ -1286,7 +1290,7 @@ class K2EditApp(App):
     
     async def on_ai_model_selector_model_selected(self, message: AIModelSelector.ModelSelected) -> None:
         """Handle AI model selection."""
-        await self.logger.info(f"AI model changed to: {message.model_name} ({message.model_id})")
+        await self.logger.info("AI model changed to: %s (%s)", message.model_name, message.model_id)
         
         # Update the agent integration with the new model
         if self.agent_integration:
@@ -1311,19 +1315,30 @@ class K2EditApp(App):
                 # Update KimiAPI configuration
                 if hasattr(self.kimi_api, 'update_config'):
                     await self.kimi_api.update_config(api_address, api_key, model_id)
-                await self.logger.info(f"Updated API configuration for model: {model_id}")
+                await self.logger.info("Updated API configuration for model: %s", model_id)
             else:
-                await self.logger.warning(f"No API configuration found for model: {model_id}")
+                await self.logger.warning("No API configuration found for model: %s", model_id)
                 self.output_panel.add_warning(f"No API configuration found for {model_id}. Please configure in Settings.")
         except Exception as e:
-            await self.logger.error(f"Failed to update API configuration: {e}")
+            await self.logger.error("Failed to update API configuration: %s", e)
             self.output_panel.add_error(f"Failed to update API configuration: {e}")
 
 
 def main():
     """Main entry point."""
-    # Load environment variables
-    load_dotenv()
+    # Performance optimization: use uvloop for the app's event loop on Unix systems.
+    # Installed here rather than at import so importing this module (tests, tooling)
+    # does not swap the process-wide event loop policy
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            # uvloop not available, continue with default event loop
+            pass
+    
+    # Load environment variables from ./.env and the checkout's .env
+    load_env_files()
 
     # Setup logging - can be configured via environment variable
     log_level = os.getenv("K2EDIT_LOG_LEVEL", "DEBUG")
@@ -1333,15 +1348,9 @@ def main():
     initial_file = None
     
     if len(sys.argv) > 1:
+        # Not stat'ed here: open_path resolves file vs directory on mount and reports
+        # a missing path through the output panel
         initial_file = sys.argv[1]
-        # Validate initial file path
-        if initial_file:
-            path = Path(initial_file)
-            if not path.exists():
-                print(f"Error: File or directory '{initial_file}' does not exist")
-                sys.exit(1)
-            # If it's a directory, we'll let the application handle it
-            # The FileInitializer will handle directory vs file logic
 
     # Create and run the application with proper cleanup
     app = K2EditApp(initial_file=initial_file, logger=logger)
@@ -2,33 +2,57 @@
 """Nim syntax highlighting module for Textual."""
 
 import os
+from functools import lru_cache
+from types import ModuleType
 from typing import Optional
 
+# highlights.scm contents, read once per process and shared by every editor
+_NIM_QUERY_SRC: Optional[str] = None
+
+@lru_cache(maxsize=1)
+def _nim_module() -> Optional[ModuleType]:
+    """tree_sitter_nim, or None if not installed; probed once, on first use rather
+    than at import so startup does not pay for it when no Nim file is opened."""
+    try:
+        import tree_sitter_nim
+        return tree_sitter_nim
+    except ImportError:
+        return None
+
+@lru_cache(maxsize=1)
 def get_nim_language() -> Optional[object]:
-    """Get the Nim language object from tree-sitter-nim."""
+    """Get the Nim language object from tree-sitter-nim (built once per process)."""
+    tree_sitter_nim = _nim_module()
+    if tree_sitter_nim is None:
+        return None
     try:
         import tree_sitter
-        import tree_sitter_nim
-        
-        # Get the language pointer from tree-sitter-nim
-        language_ptr = tree_sitter_nim.language()
-        
-        return tree_sitter.Language(language_ptr)
-            
     except ImportError:
         return None
+    
+    # Get the language pointer from tree-sitter-nim
+    return tree_sitter.Language(tree_sitter_nim.language())
 
 async def get_nim_highlight_query() -> str:
     """Get the Nim syntax highlighting query from the official tree-sitter-nim package."""
+    global _NIM_QUERY_SRC
+    if _NIM_QUERY_SRC is not None:
+        return _NIM_QUERY_SRC
+    
+    tree_sitter_nim = _nim_module()
+    if tree_sitter_nim is None:
+        # No query without the package, matching get_nim_language()
+        return ""
+    
     import aiofiles
-    import tree_sitter_nim
     # Get the path to the queries directory in the tree-sitter-nim package
     package_dir = os.path.dirname(tree_sitter_nim.__file__)
     highlights_file = os.path.join(package_dir, "queries", "highlights.scm")
     
     # Read the official highlights.scm file asynchronously
     async with aiofiles.open(highlights_file, 'r', encoding='utf-8') as f:
-        return await f.read()
+        _NIM_QUERY_SRC = await f.read()
+    return _NIM_QUERY_SRC
 
 async def register_nim_language(text_area) -> bool:
     """Register Nim language with a Textual TextArea.
@@ -52,8 +76,4 @@ async def register_nim_language(text_area) -> bool:
 
 def is_nim_available() -> bool:
     """Check if tree-sitter-nim is available."""
-    try:
-        import tree_sitter_nim
-        return True
-    except ImportError:
-        return False
\ No newline at end of file
+    return _nim_module() is not None
\ No newline at end of file
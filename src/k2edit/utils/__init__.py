@@ -11,7 +11,8 @@ from .config import (
     LoggingConfig,
     get_config,
     set_config,
-    load_config_from_file
+    load_config_from_file,
+    load_env_files
 )
 
 # Initialization imports moved to avoid circular dependencies
@@ -40,6 +41,7 @@ __all__ = [
     "get_config",
     "set_config",
     "load_config_from_file",
+    "load_env_files",
     
     # Initialization - import directly from .initialization when needed
     
@@ -191,6 +191,67 @@ class AsyncTaskQueue:
                 print(f"Worker {name} error: {e}")
 
 
+class AsyncRWLock:
+    """Reader-writer lock for coroutines.
+    
+    Any number of readers may hold the lock together; a writer holds it
+    exclusively. Waiting writers block new readers so writes are not starved.
+    
+    Usage:
+        async with lock.reader:
+            ...
+        async with lock.writer:
+            ...
+    """
+    
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+        self.reader = _RWLockSide(self._acquire_read, self._release_read)
+        self.writer = _RWLockSide(self._acquire_write, self._release_write)
+    
+    async def _acquire_read(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._writing and not self._writers_waiting)
+            self._readers += 1
+    
+    async def _release_read(self):
+        async with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+    
+    async def _acquire_write(self):
+        async with self._cond:
+            self._writers_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not self._writing and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+    
+    async def _release_write(self):
+        async with self._cond:
+            self._writing = False
+            self._cond.notify_all()
+
+
+class _RWLockSide:
+    """Async context manager for one side of an AsyncRWLock."""
+    
+    def __init__(self, acquire: Callable, release: Callable):
+        self._acquire = acquire
+        self._release = release
+    
+    async def __aenter__(self):
+        await self._acquire()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._release()
+
+
 class ConnectionPool:
     """Generic connection pool for managing expensive resources.
     
@@ -4,6 +4,12 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+# Checkout root (utils -> k2edit -> src -> root), where the README has
+# `cp .env.example .env`; for an installed package this is not a checkout
+_CHECKOUT_ROOT = Path(__file__).resolve().parents[3]
+
 
 @dataclass
 class UIConfig:
@@ -119,4 +125,19 @@ def load_config_from_file(config_file: Path) -> K2EditConfig:
     """Load configuration from file and set as global."""
     config = K2EditConfig(config_file)
     set_config(config)
-    return config
\ No newline at end of file
+    return config
+
+
+def load_env_files():
+    """Load ./.env, then the checkout's .env; variables already set are kept.
+
+    Explicit is_file() checks on the two known locations replace find_dotenv()'s
+    upward directory walk. The checkout's .env is only read when running from a
+    source tree (setup.py next to it), never from an installed package's prefix.
+    """
+    env_paths = [Path(".env")]
+    if (_CHECKOUT_ROOT / "setup.py").is_file():
+        env_paths.append(_CHECKOUT_ROOT / ".env")
+    for env_path in env_paths:
+        if env_path.is_file():
+            load_dotenv(env_path)
\ No newline at end of file
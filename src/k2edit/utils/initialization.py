@@ -1,6 +1,5 @@
 """Shared initialization utilities for K2Edit."""
 
-from pathlib import Path
 from typing import Optional, Callable, Any
 from aiologger import Logger
 from ..agent.integration import K2EditAgentIntegration
@@ -100,9 +99,9 @@ class AgentInitializer:
         """Start language server if not already running for the file's language."""
         try:
             from ..agent.language_configs import LanguageConfigs
-            from .language_utils import detect_language_by_extension
+            from .language_utils import detect_language_from_filename
             
-            language = detect_language_by_extension(Path(file_path).suffix)
+            language = detect_language_from_filename(file_path)
             
             if (language != "unknown" and 
                 not agent_integration.lsp_client.is_server_running(language)):
@@ -8,6 +8,68 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 
+# Language configuration mapping, built once at import time
+_EXT_TO_LANGUAGE = {
+    '.py': 'python',
+    '.js': 'javascript', 
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.html': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.xml': 'xml',
+    '.sql': 'sql',
+    '.sh': 'shell',
+    '.md': 'markdown',
+    '.nim': 'nim'
+}
+
+# Display-friendly language mapping
+_EXT_TO_DISPLAY_NAME = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'JavaScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.xml': 'XML',
+    '.sql': 'SQL',
+    '.sh': 'Shell',
+    '.md': 'Markdown',
+    '.nim': 'Nim'
+}
+
+
+def _file_extension(file_path) -> str:
+    """Suffix of the last path component, as PurePath.suffix, without building a Path."""
+    name = os.path.basename(file_path)
+    dot = name.rfind('.')
+    return name[dot:] if 0 < dot < len(name) - 1 else ''
+
+
 def detect_language_by_extension(extension: str) -> str:
     """Detect language based on file extension.
     
@@ -17,36 +79,7 @@ def detect_language_by_extension(extension: str) -> str:
     Returns:
         Language name or 'unknown' if not recognized
     """
-    extension = extension.lower()
-    
-    # Language configuration mapping
-    ext_to_language = {
-        '.py': 'python',
-        '.js': 'javascript', 
-        '.ts': 'typescript',
-        '.jsx': 'javascript',
-        '.tsx': 'typescript',
-        '.java': 'java',
-        '.cpp': 'cpp',
-        '.c': 'c',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.rb': 'ruby',
-        '.php': 'php',
-        '.html': 'html',
-        '.css': 'css',
-        '.scss': 'scss',
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.xml': 'xml',
-        '.sql': 'sql',
-        '.sh': 'shell',
-        '.md': 'markdown',
-        '.nim': 'nim'
-    }
-    
-    return ext_to_language.get(extension, 'unknown')
+    return _EXT_TO_LANGUAGE.get(extension.lower(), 'unknown')
 
 
 def detect_language_from_filename(filename: str) -> str:
@@ -61,8 +94,7 @@ def detect_language_from_filename(filename: str) -> str:
     if not filename:
         return 'unknown'
         
-    _, ext = os.path.splitext(filename)
-    return detect_language_by_extension(ext)
+    return detect_language_by_extension(_file_extension(filename))
 
 
 def detect_language_from_file_path(file_path: str) -> str:
@@ -77,35 +109,7 @@ def detect_language_from_file_path(file_path: str) -> str:
     if not file_path:
         return ""
     
-    # Display-friendly language mapping
-    ext_map = {
-        '.py': 'Python',
-        '.js': 'JavaScript',
-        '.ts': 'TypeScript',
-        '.jsx': 'JavaScript',
-        '.tsx': 'TypeScript',
-        '.java': 'Java',
-        '.cpp': 'C++',
-        '.c': 'C',
-        '.go': 'Go',
-        '.rs': 'Rust',
-        '.rb': 'Ruby',
-        '.php': 'PHP',
-        '.html': 'HTML',
-        '.css': 'CSS',
-        '.scss': 'SCSS',
-        '.json': 'JSON',
-        '.yaml': 'YAML',
-        '.yml': 'YAML',
-        '.xml': 'XML',
-        '.sql': 'SQL',
-        '.sh': 'Shell',
-        '.md': 'Markdown',
-        '.nim': 'Nim'
-    }
-    
-    ext = Path(file_path).suffix.lower()
-    return ext_map.get(ext, "")
+    return _EXT_TO_DISPLAY_NAME.get(_file_extension(file_path).lower(), "")
 
 
 def detect_project_language(project_root: str) -> str:
@@ -133,7 +137,9 @@ def detect_project_language(project_root: str) -> str:
     # Check config files first (more reliable indicators)
     for lang, indicators in config_indicators.items():
         for indicator in indicators:
-            if list(root.glob(indicator)) or (not indicator.startswith('*') and list(root.rglob(indicator))):
+            # Only existence matters: stop at the first hit instead of materialising every match
+            if (next(root.glob(indicator), None) is not None
+                    or (not indicator.startswith('*') and next(root.rglob(indicator), None) is not None)):
                 return lang
     
     # If no config files found, check for source file extensions
@@ -152,7 +158,7 @@ def detect_project_language(project_root: str) -> str:
     for lang, extensions in extension_indicators.items():
         count = 0
         for ext in extensions:
-            count += len(list(root.rglob(f"*{ext}")))
+            count += sum(1 for _ in root.rglob(f"*{ext}"))
         if count > 0:
             file_counts[lang] = count
     
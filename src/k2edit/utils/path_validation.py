@@ -1,9 +1,13 @@
 """Path validation utilities for K2Edit."""
 
 import asyncio
+import os
+import stat
+import threading
+import time
 import aiofiles
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 
 class PathValidationError(Exception):
@@ -11,6 +15,39 @@ class PathValidationError(Exception):
     pass
 
 
+# Short-lived stat results: opening one path probes it from several handlers and
+# validators within a few milliseconds. Called from worker threads, so the cache is
+# guarded by a lock
+_STAT_CACHE: Dict[str, Tuple[float, int]] = {}
+_STAT_CACHE_LOCK = threading.Lock()
+_STAT_TTL = 1.0
+_STAT_CACHE_SIZE = 256
+
+
+def stat_mode(path: Path) -> Optional[int]:
+    """st_mode of a path, or None if it does not exist; existing paths are cached for _STAT_TTL seconds"""
+    key = str(path)
+    now = time.monotonic()
+    with _STAT_CACHE_LOCK:
+        cached = _STAT_CACHE.get(key)
+    if cached is not None and now - cached[0] < _STAT_TTL:
+        return cached[1]
+    
+    try:
+        mode = os.stat(key).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        mode = None
+    
+    with _STAT_CACHE_LOCK:
+        _STAT_CACHE.pop(key, None)
+        # A missing path is never cached: it may be created at any moment
+        if mode is not None:
+            if len(_STAT_CACHE) >= _STAT_CACHE_SIZE:
+                del _STAT_CACHE[next(iter(_STAT_CACHE))]
+            _STAT_CACHE[key] = (now, mode)
+    return mode
+
+
 def validate_file_path(file_path: str, allow_create: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Validate a file path for opening/loading operations.
@@ -28,8 +65,11 @@ def validate_file_path(file_path: str, allow_create: bool = False) -> Tuple[bool
             
         path = Path(file_path)
         
+        # One stat answers existence and file type together
+        mode = stat_mode(path)
+        
         # Check if path exists
-        if not path.exists():
+        if mode is None:
             if allow_create:
                 # Check if parent directory exists or can be created
                 try:
@@ -41,11 +81,11 @@ def validate_file_path(file_path: str, allow_create: bool = False) -> Tuple[bool
                 return False, f"File or directory does not exist: {file_path}"
         
         # Check if it's a directory when we expect a file
-        if path.is_dir():
+        if stat.S_ISDIR(mode):
             return False, f"Path is a directory, not a file: {file_path}"
             
         # Check if file is readable
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             return False, f"Path exists but is not a regular file: {file_path}"
             
         # Note: File access test will be done by caller using async operations
@@ -73,9 +113,10 @@ def validate_directory_path(dir_path: str, allow_create: bool = False) -> Tuple[
             return False, "Directory path cannot be empty"
             
         path = Path(dir_path)
+        mode = stat_mode(path)
         
         # Check if path exists
-        if not path.exists():
+        if mode is None:
             if allow_create:
                 try:
                     path.mkdir(parents=True, exist_ok=True)
@@ -86,12 +127,13 @@ def validate_directory_path(dir_path: str, allow_create: bool = False) -> Tuple[
                 return False, f"Directory does not exist: {dir_path}"
         
         # Check if it's actually a directory
-        if not path.is_dir():
+        if not stat.S_ISDIR(mode):
             return False, f"Path exists but is not a directory: {dir_path}"
             
-        # Check if directory is accessible
+        # Check if directory is accessible; opening it is enough, without reading every entry
         try:
-            list(path.iterdir())
+            with os.scandir(path):
+                pass
         except (PermissionError, OSError) as e:
             return False, f"Cannot access directory: {e}"
             
@@ -175,7 +217,8 @@ async def async_validate_file_path(file_path: str, allow_create: bool = False) -
         path = Path(file_path)
         
         # Test actual file access asynchronously if file exists
-        if path.exists() and path.is_file():
+        mode = stat_mode(path)
+        if mode is not None and stat.S_ISREG(mode):
             try:
                 async with aiofiles.open(path, 'r', encoding='utf-8') as f:
                     # Just test if we can open it
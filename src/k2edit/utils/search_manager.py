@@ -2,6 +2,7 @@
 
 import re
 import aiofiles
+from bisect import bisect_left, bisect_right
 from typing import List, Tuple, Optional
 from pathlib import Path
 import multiprocessing as mp
@@ -12,6 +13,8 @@ from .async_performance_utils import get_thread_pool
 class SearchMatch:
     """Represents a search match."""
     
+    __slots__ = ("start_line", "start_col", "end_line", "end_col", "text")
+    
     def __init__(self, start_line: int, start_col: int, end_line: int, end_col: int, text: str):
         self.start_line = start_line
         self.start_col = start_col
@@ -34,6 +37,21 @@ class FileSearchResult:
         return f"FileSearchResult({self.file_path}, {len(self.matches)} matches)"
 
 
+_NEWLINE_RE = re.compile('\n')
+
+
+def _line_start_offsets(text: str) -> List[int]:
+    """Offset of the first character of each '\n'-separated line in text."""
+    line_starts = [0]
+    line_starts.extend(newline.end() for newline in _NEWLINE_RE.finditer(text))
+    return line_starts
+
+
+def _match_positions(matches: List[SearchMatch]) -> List[Tuple[int, int]]:
+    """(line, column) sort keys for matches, in the document order search_in_text returns them."""
+    return [(match.start_line, match.start_col) for match in matches]
+
+
 def _search_file_chunk(file_chunk: List[Path], pattern: str, case_sensitive: bool, regex: bool) -> List[FileSearchResult]:
     """Worker function for multiprocessing file search."""
     results = []
@@ -80,7 +98,6 @@ class SearchManager:
             return []
         
         matches = []
-        lines = text.split('\n')
         
         try:
             if regex:
@@ -92,6 +109,24 @@ class SearchManager:
                 flags = 0 if case_sensitive else re.IGNORECASE
                 compiled_pattern = re.compile(escaped_pattern, flags)
             
+            if not regex and '\n' not in pattern:
+                # A literal cannot span lines: scan the whole text once and map each match
+                # offset to its line through the line-start offsets, skipping match-free lines
+                line_starts = _line_start_offsets(text)
+                for match in compiled_pattern.finditer(text):
+                    start = match.start()
+                    line_idx = bisect_right(line_starts, start) - 1
+                    line_start = line_starts[line_idx]
+                    matches.append(SearchMatch(
+                        start_line=line_idx,
+                        start_col=start - line_start,
+                        end_line=line_idx,
+                        end_col=match.end() - line_start,
+                        text=match.group()
+                    ))
+                return matches
+            
+            lines = text.split('\n')
             for line_idx, line in enumerate(lines):
                 for match in compiled_pattern.finditer(line):
                     start_col = match.start()
@@ -121,14 +156,13 @@ class SearchManager:
         if not matches:
             return None
         
-        # Find the first match after current position
-        for match in matches:
-            if (match.start_line > current_line or 
-                (match.start_line == current_line and match.start_col > current_col)):
-                return match
+        # Matches come back in document order, so binary-search the first one after the cursor
+        index = bisect_right(_match_positions(matches), (current_line, current_col))
+        if index < len(matches):
+            return matches[index]
         
         # If no match found after current position, wrap to beginning
-        return matches[0] if matches else None
+        return matches[0]
     
     def find_previous_match(self, text: str, pattern: str, current_line: int, current_col: int,
                            case_sensitive: bool = False, regex: bool = False) -> Optional[SearchMatch]:
@@ -138,14 +172,13 @@ class SearchManager:
         if not matches:
             return None
         
-        # Find the last match before current position
-        for match in reversed(matches):
-            if (match.start_line < current_line or 
-                (match.start_line == current_line and match.start_col < current_col)):
-                return match
+        # Binary-search the last match before the cursor
+        index = bisect_left(_match_positions(matches), (current_line, current_col))
+        if index > 0:
+            return matches[index - 1]
         
         # If no match found before current position, wrap to end
-        return matches[-1] if matches else None
+        return matches[-1]
     
     def replace_in_text(self, text: str, pattern: str, replacement: str, 
                        case_sensitive: bool = False, regex: bool = False, 
@@ -169,6 +202,23 @@ class SearchManager:
                 # Replace all occurrences
                 new_text, count = compiled_pattern.subn(replacement, text)
                 return new_text, count
+            elif not regex and '\n' not in pattern:
+                # A literal cannot span lines: one search from the cursor offset finds
+                # the same match as the line-by-line scan, and a miss returns the text untouched
+                if current_line < 0:
+                    offset = 0
+                else:
+                    line_starts = _line_start_offsets(text)
+                    if current_line >= len(line_starts):
+                        return text, 0
+                    line_start = line_starts[current_line]
+                    line_end = line_starts[current_line + 1] - 1 if current_line + 1 < len(line_starts) else len(text)
+                    offset = line_start + min(max(current_col, 0), line_end - line_start)
+                
+                match = compiled_pattern.search(text, offset)
+                if not match:
+                    return text, 0
+                return text[:match.start()] + replacement + text[match.end():], 1
             else:
                 # Replace only the next occurrence after current position
                 lines = text.split('\n')
@@ -193,6 +243,8 @@ class SearchManager:
                         replacement_count = 1
                         break
                 
+                if not replacement_count:
+                    return text, 0
                 return '\n'.join(lines), replacement_count
         
         except re.error as e:
@@ -297,18 +349,12 @@ class SearchManager:
                          regex: bool = False) -> List[Tuple[int, int]]:
         """Return list of (start_offset, end_offset) for highlighting matches."""
         matches = self.search_in_text(text, pattern, case_sensitive, regex)
-        highlights = []
-        
-        lines = text.split('\n')
-        current_offset = 0
-        
-        for line_idx, line in enumerate(lines):
-            for match in matches:
-                if match.start_line == line_idx:
-                    start_offset = current_offset + match.start_col
-                    end_offset = current_offset + match.end_col
-                    highlights.append((start_offset, end_offset))
-            
-            current_offset += len(line) + 1  # +1 for newline character
+        if not matches:
+            return []
         
-        return highlights
\ No newline at end of file
+        # One pass over the matches, offsetting each by its line's start (matches are in line order)
+        line_starts = _line_start_offsets(text)
+        return [
+            (line_starts[match.start_line] + match.start_col, line_starts[match.start_line] + match.end_col)
+            for match in matches
+        ]
\ No newline at end of file
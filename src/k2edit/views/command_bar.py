@@ -73,7 +73,6 @@ class CommandBar(Input):
         # Clear the input immediately to prevent duplicate submissions
         self.value = ""
         self.cursor_position = 0
-        self.refresh()
         
         # Ensure focus returns to editor to complete the clearing
         if self.editor:
@@ -5,8 +5,10 @@ This module provides a tree-style file explorer widget that allows users
 to browse and open files from the filesystem.
 """
 
+import asyncio
+import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 from textual.widgets import Static, Tree
 from textual.widgets.tree import TreeNode
 from textual.reactive import reactive
@@ -15,6 +17,40 @@ from textual import events
 from ..logger import get_logger
 
 
+# (name, path, children) per entry; children is None for files
+DirectoryListing = List[Tuple[str, str, Optional["DirectoryListing"]]]
+
+
+def _scan_directory(path: Path) -> DirectoryListing:
+    """Recursively list a directory, directories first, skipping hidden entries.
+    
+    Runs in a worker thread, so it touches only the filesystem. os.scandir reports
+    entry types from the directory read itself, without a stat per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = [entry for entry in it if not entry.name.startswith('.')]
+    except OSError:
+        # Missing, not a directory, or not accessible
+        return []
+    
+    def _is_file(entry) -> bool:
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+    
+    entries.sort(key=lambda entry: (_is_file(entry), entry.name.lower()))
+    listing: DirectoryListing = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        listing.append((entry.name, entry.path, _scan_directory(entry.path) if is_dir else None))
+    return listing
+
+
 class FileExplorer(Static):
     """A file explorer widget for navigating the filesystem."""
     
@@ -94,6 +130,8 @@ class FileExplorer(Static):
         self.root_path = root_path or Path.cwd()
         self.current_path = self.root_path
         self.logger = logger or get_logger()
+        # Files seen by the last directory scan; lets handlers skip a stat for them
+        self.known_files: Set[str] = set()
         
         # Resize functionality attributes
         self._is_resizing = False
@@ -108,47 +146,37 @@ class FileExplorer(Static):
         tree = Tree(str(self.root_path))
         tree.show_root = False
         tree.guide_depth = 3
-        
-        # Build initial tree
-        self._build_tree(tree)
-        
         yield tree
     
-    def _build_tree(self, tree: Tree) -> None:
-        """Build the file tree starting from root_path."""
-        self._add_directory(tree.root, self.root_path)
+    def on_mount(self) -> None:
+        """Start the initial directory scan once the tree is mounted."""
+        self._build_tree()
     
-    def _add_directory(self, parent: TreeNode, path: Path) -> None:
-        """Add a directory and its contents to the tree."""
-        # Debug: Check if path is actually a string instead of Path object
-        if isinstance(path, str):
-            # This is the bug! Convert string to Path object
-            path = Path(path)
-        
-        if not path.exists() or not path.is_dir():
-            return
-            
-        try:
-            # Get directory contents
-            contents = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
-        except (PermissionError, OSError):
-            # Skip directories we can't access
-            return
-        
-        for item in contents:
-            # Skip hidden files and directories
-            if item.name.startswith('.'):
-                continue
-                
-            if item.is_dir():
-                dir_node = parent.add(item.name, expand=False)
+    def _build_tree(self) -> None:
+        """Rebuild the file tree from root_path in a background worker."""
+        self.run_worker(self._load_tree(Path(self.root_path)), group="explorer", exclusive=True)
+    
+    async def _load_tree(self, root: Path) -> None:
+        """Scan root off the event loop, then populate the tree in one pass."""
+        listing = await asyncio.to_thread(_scan_directory, root)
+        tree = self.query_one(Tree)
+        tree.clear()
+        self.known_files = set()
+        self._add_directory(tree.root, listing)
+    
+    def _add_directory(self, parent: TreeNode, listing: DirectoryListing) -> None:
+        """Add a scanned directory listing and its contents to the tree."""
+        for name, item_path, children in listing:
+            if children is not None:
+                dir_node = parent.add(name, expand=False)
                 dir_node.label_style = "directory"
-                dir_node.data = {"type": "directory", "path": str(item)}
+                dir_node.data = {"type": "directory", "path": item_path}
                 # Recursively add subdirectories
-                self._add_directory(dir_node, item)
+                self._add_directory(dir_node, children)
             else:
-                file_node = parent.add_leaf(item.name, data={"type": "file", "path": str(item)})
+                file_node = parent.add_leaf(name, data={"type": "file", "path": item_path})
                 file_node.label_style = "file"
+                self.known_files.add(item_path)
     
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Handle tree node selection."""
@@ -199,9 +227,7 @@ class FileExplorer(Static):
     
     def refresh_explorer(self) -> None:
         """Refresh the entire file explorer."""
-        tree = self.query_one(Tree)
-        tree.clear()
-        self._build_tree(tree)
+        self._build_tree()
     
     async def set_root_path(self, path: Path) -> None:
         """Set a new root path for the explorer."""
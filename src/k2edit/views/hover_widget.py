@@ -4,7 +4,7 @@
 from textual.widgets import Markdown
 from textual.containers import Container
 from textual.widget import Widget
-from ..logger import Logger
+from ..logger import Logger, LogLevel
 
 
 class HoverWidget(Widget):
@@ -45,14 +45,19 @@ class HoverWidget(Widget):
         
         # Use the provided cursor position parameters
         cursor_line, cursor_column = line, column
+        # Hover is repositioned on every request; skip building the trace strings
+        # unless debug logging is on
+        debug = self.logger.is_enabled_for(LogLevel.DEBUG)
         
-        await self.logger.debug(f"Editor region: {editor_region}")
-        await self.logger.debug(f"Cursor location: line={cursor_line}, column={cursor_column}")
+        if debug:
+            await self.logger.debug(f"Editor region: {editor_region}")
+            await self.logger.debug(f"Cursor location: line={cursor_line}, column={cursor_column}")
         
         # Calculate absolute screen coordinates
         # Add editor's position to cursor position, accounting for scroll offset
         scroll_offset = editor.scroll_offset
-        await self.logger.debug(f"Editor scroll offset: {scroll_offset}")
+        if debug:
+            await self.logger.debug(f"Editor scroll offset: {scroll_offset}")
         
         # Adjust cursor position by scroll offset
         visible_cursor_line = cursor_line - scroll_offset.y
@@ -64,10 +69,9 @@ class HoverWidget(Widget):
         # Position hover widget slightly offset from cursor
         hover_x = absolute_x + 1
         
-        # Force widget to measure itself to get accurate height
-        self.refresh(layout=True)
-        
-        # Get widget height to position it properly above cursor
+        # Get widget height to position it properly above cursor. The display
+        # and offset style changes already schedule the layout pass, so no
+        # explicit refresh(layout=True) is needed here.
         widget_height = self.size.height
 
         # If widget still has no height after refresh, calculate based on content
@@ -75,10 +79,12 @@ class HoverWidget(Widget):
             # Count lines in content to estimate height
             content_lines = len(content.split('\n'))
             widget_height = content_lines + 2  # Add padding for borders/margins
-            await self.logger.debug(f"Widget height calculated from content lines: {content_lines} -> height: {widget_height}")
+            if debug:
+                await self.logger.debug(f"Widget height calculated from content lines: {content_lines} -> height: {widget_height}")
         
         hover_y = max(0, absolute_y - widget_height - 1)  # Position above cursor with widget height offset
-        await self.logger.debug(f"Positioning: absolute_y={absolute_y}, widget_height={widget_height}, final hover_y={hover_y}")
+        if debug:
+            await self.logger.debug(f"Positioning: absolute_y={absolute_y}, widget_height={widget_height}, final hover_y={hover_y}")
         
         # Use absolute positioning with screen overlay
         # The offset is relative to the screen origin (0,0) when using overlay="screen"
@@ -86,9 +92,10 @@ class HoverWidget(Widget):
         self.styles.position = "absolute"
         self.styles.offset = (hover_x, hover_y)
         
-        await self.logger.debug(f"Hover positioned at absolute coordinates: ({hover_x}, {hover_y})")
-        await self.logger.debug(f"Calculated from editor region ({editor_region.x}, {editor_region.y}) + visible cursor ({visible_cursor_column}, {visible_cursor_line})")
-        await self.logger.debug(f"Original cursor ({cursor_column}, {cursor_line}) adjusted by scroll offset ({scroll_offset.x}, {scroll_offset.y})")
+        if debug:
+            await self.logger.debug(f"Hover positioned at absolute coordinates: ({hover_x}, {hover_y})")
+            await self.logger.debug(f"Calculated from editor region ({editor_region.x}, {editor_region.y}) + visible cursor ({visible_cursor_column}, {visible_cursor_line})")
+            await self.logger.debug(f"Original cursor ({cursor_column}, {cursor_line}) adjusted by scroll offset ({scroll_offset.x}, {scroll_offset.y})")
         
     async def hide_hover(self) -> None:
         """Hide the hover widget."""
@@ -11,6 +11,20 @@ from rich.text import Text
 from datetime import datetime
 
 
+def _build_welcome_panel() -> Panel:
+    """Build the welcome banner; it never changes, so it is built once and reused."""
+    welcome_text = Text()
+    welcome_text.append("AI Assistant Ready\n", style="bold blue")
+    return Panel(
+        welcome_text,
+        title="AI Assistant",
+        border_style="blue"
+    )
+
+
+_WELCOME_PANEL = _build_welcome_panel()
+
+
 class OutputPanel(Vertical):
     """Panel for displaying command outputs and AI responses."""
     
@@ -57,18 +71,22 @@ class OutputPanel(Vertical):
         self._resize_start_width = 0
         self._min_width = 15
         self._edge_threshold = 2
-    
-    def compose(self):
-        """Compose the output panel layout."""
-        yield Static("[bold]AI Assistant[/bold]", id="output-title")
-        yield RichLog(
-            highlight=True,
-            markup=True,
+        
+        # Built once and reused for every write. Only Rich renderables are
+        # written, so markup parsing and repr highlighting of str are off.
+        self._output_log = RichLog(
+            highlight=False,
+            markup=False,
             wrap=True,
             auto_scroll=True,
             id="output-log"
         )
     
+    def compose(self):
+        """Compose the output panel layout."""
+        yield Static("[bold]AI Assistant[/bold]", id="output-title")
+        yield self._output_log
+    
     def on_mount(self) -> None:
         """Initialize the output panel."""
         # Output panel is ready for AI responses and command results
@@ -77,16 +95,8 @@ class OutputPanel(Vertical):
     
     def add_welcome_message(self) -> None:
         """Add a welcome message to the output panel."""
-        welcome_text = Text()
-        welcome_text.append("AI Assistant Ready\n", style="bold blue")
- 
-        panel = Panel(
-            welcome_text,
-            title="AI Assistant",
-            border_style="blue"
-        )
-        log = self.query_one("#output-log", RichLog)
-        log.write(panel)
+        log = self._output_log
+        log.write(_WELCOME_PANEL)
     
     def add_command_result(self, command: str, result: str) -> None:
         """Add a command result to the output panel."""
@@ -98,7 +108,7 @@ class OutputPanel(Vertical):
         command_header.append("Command: ", style="bold blue")
         command_header.append(command, style="cyan")
         
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if log:
             log.write(command_header)
             
@@ -119,7 +129,7 @@ class OutputPanel(Vertical):
         query_header.append("You: ", style="bold green")
         query_header.append(query, style="white")
         
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if log:
             log.write(query_header)
             
@@ -148,7 +158,7 @@ class OutputPanel(Vertical):
             error_text.append("Error: ", style="bold red")
             error_text.append(error_message, style="red")
             
-            log = self.query_one("#output-log", RichLog)
+            log = self._output_log
             if log:
                 log.write(error_text)
         except AttributeError as e:
@@ -168,7 +178,7 @@ class OutputPanel(Vertical):
             info_text.append("Info: ", style="bold blue")
             info_text.append(info_message, style="blue")
             
-            log = self.query_one("#output-log", RichLog)
+            log = self._output_log
             if log:
                 log.write(info_text)
         except AttributeError as e:
@@ -197,7 +207,7 @@ class OutputPanel(Vertical):
         tool_text.append(", ".join(arg_parts), style="cyan")
         tool_text.append(")", style="yellow")
         
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if log:
             log.write(tool_text)
             
@@ -209,7 +219,7 @@ class OutputPanel(Vertical):
     
     def _display_content(self, content: str) -> None:
         """Display content with appropriate formatting."""
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if not log:
             return
             
@@ -228,7 +238,7 @@ class OutputPanel(Vertical):
     
     def _display_markdown(self, content: str) -> None:
         """Display content as markdown."""
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if not log:
             return
             
@@ -237,7 +247,7 @@ class OutputPanel(Vertical):
     
     def _display_code(self, content: str, language: str = "text") -> None:
         """Display content as syntax-highlighted code."""
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if not log:
             return
             
@@ -252,7 +262,7 @@ class OutputPanel(Vertical):
     
     def clear_output(self) -> None:
         """Clear the output panel."""
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         log.clear()
         self.add_welcome_message()
     
@@ -285,7 +295,7 @@ class OutputPanel(Vertical):
             # Handle custom status messages
             progress_text.append(str(status), style="cyan")
         
-        log = self.query_one("#output-log", RichLog)
+        log = self._output_log
         if log:
             log.write(progress_text)
     
@@ -14,10 +14,14 @@ from textual.message import Message
 from textual.screen import Screen
 from textual import work
 from aiologger import Logger
+from aiologger.levels import LogLevel
 import asyncio
 from ..utils.language_utils import detect_language_from_file_path
 from ..utils.file_utils import detect_encoding
 
+# Bound once; formats the "Ln X, Col Y" cursor label on every cursor move
+_CURSOR_POS_FORMAT = "Ln {}, Col {}".format
+
 class GitBranchSwitch(Message):
     """Message to request git branch switching."""
     def __init__(self, branch_name: str) -> None:
@@ -69,12 +73,12 @@ class StatusBar(Widget):
     def watch_cursor_line(self, cursor_line: int) -> None:
         """Watch for cursor line changes."""
         if hasattr(self, 'cursor_pos_widget') and self.cursor_pos_widget:
-            self.cursor_pos_widget.update(f"Ln {cursor_line}, Col {self.cursor_column}")
+            self.cursor_pos_widget.update(_CURSOR_POS_FORMAT(cursor_line, self.cursor_column))
 
     def watch_cursor_column(self, cursor_column: int) -> None:
         """Watch for cursor column changes."""
         if hasattr(self, 'cursor_pos_widget') and self.cursor_pos_widget:
-            self.cursor_pos_widget.update(f"Ln {self.cursor_line}, Col {cursor_column}")
+            self.cursor_pos_widget.update(_CURSOR_POS_FORMAT(self.cursor_line, cursor_column))
 
     def watch_diagnostics_warnings(self, warnings: int) -> None:
         """Watch for diagnostics warnings changes."""
@@ -88,11 +92,14 @@ class StatusBar(Widget):
 
     def watch_language_server_status(self, status: str) -> None:
         """Watch for language server status changes."""
-        self.logger.debug(f"watch_language_server_status: {status}")
+        debug = self.logger.is_enabled_for(LogLevel.DEBUG)
+        if debug:
+            self.logger.debug(f"watch_language_server_status: {status}")
         if hasattr(self, 'lsp_status_widget') and self.lsp_status_widget:
             new_text = f"LSP: {status}"
             self.lsp_status_widget.update(new_text)
-            self.logger.debug(f"Updated LSP status widget to: {new_text}")
+            if debug:
+                self.logger.debug(f"Updated LSP status widget to: {new_text}")
 
     def watch_language(self, language: str) -> None:
         """Watch for language changes."""
@@ -117,6 +124,7 @@ class StatusBar(Widget):
     def __init__(self, logger: Logger = None, **kwargs):
         super().__init__(**kwargs)
         self.logger = logger or Logger.with_default_handlers(name='StatusBar')
+        self._analyzed_content = ""
 
         # Construct widgets first (before reactive initialization)
         self.git_branch_widget = Button("main", id="git-branch", classes="status-button")
@@ -410,22 +418,30 @@ class StatusBar(Widget):
 
     def update_cursor_position(self, line: int, column: int):
         """Update cursor position."""
-        self.cursor_line = line
-        self.cursor_column = column
+        if line == self.cursor_line and column == self.cursor_column:
+            return
+        # Set both values without their watchers so the label is formatted
+        # and the Static updated once, not once per coordinate
+        self.set_reactive(StatusBar.cursor_line, line)
+        self.set_reactive(StatusBar.cursor_column, column)
+        self.cursor_pos_widget.update(_CURSOR_POS_FORMAT(line, column))
 
     def update_language_server_status(self, status: str):
         """Update language server status in status bar."""
-        self.logger.debug(f"update_language_server_status called with: {status}")
+        debug = self.logger.is_enabled_for(LogLevel.DEBUG)
+        if debug:
+            self.logger.debug(f"update_language_server_status called with: {status}")
         # Update the reactive property to trigger watcher
         self.language_server_status = status
-        self.logger.debug(f"Set language_server_status reactive property to: {status}")
+        if debug:
+            self.logger.debug(f"Set language_server_status reactive property to: {status}")
     
     def _detect_indentation(self, content: str) -> str:
         """Detect indentation type and size from content."""
         if not content:
             return "Spaces: 4"
         lines = content.splitlines()
-        space_indents = []
+        space_indents = set()
         tab_lines = 0
         for line in lines:
             if not line.strip():
@@ -435,7 +451,7 @@ class StatusBar(Widget):
             elif line.startswith(' '):
                 indent_size = len(line) - len(line.lstrip(' '))
                 if indent_size > 0:
-                    space_indents.append(indent_size)
+                    space_indents.add(indent_size)
         if tab_lines and space_indents:
             return "Mixed"
         if tab_lines:
@@ -445,7 +461,7 @@ class StatusBar(Widget):
         # Find the most common step size (difference between consecutive indents)
         from math import gcd
         from functools import reduce
-        unique_sizes = sorted(set(space_indents))
+        unique_sizes = sorted(space_indents)
         if len(unique_sizes) == 1:
             return f"Spaces: {unique_sizes[0]}"
         steps = [j - i for i, j in zip(unique_sizes[:-1], unique_sizes[1:]) if j > i]
@@ -483,7 +499,9 @@ class StatusBar(Widget):
     
     async def update_from_editor(self, editor_content: str = "", file_path: str = ""):
         """Update status bar from editor content and file path."""
-        await self.logger.debug(f"update_from_editor: {file_path}")
+        debug = self.logger.is_enabled_for(LogLevel.DEBUG)
+        if debug:
+            await self.logger.debug(f"update_from_editor: {file_path}")
         if file_path:
             # Extract just the filename for display
             file_name = os.path.basename(file_path)
@@ -491,10 +509,15 @@ class StatusBar(Widget):
             
             # Detect language from file extension
             language = detect_language_from_file_path(file_path)
-            await self.logger.debug(f"Detected language: {language} for file: {file_path}")
+            if debug:
+                await self.logger.debug(f"Detected language: {language} for file: {file_path}")
             self.language = language
         
-        if editor_content:
+        # The status bar is refreshed on every cursor move; the buffer-wide
+        # scans below only need to run again when the text itself changed
+        if editor_content and editor_content != self._analyzed_content:
+            self._analyzed_content = editor_content
+            
             # Detect indentation and line ending from content
             indentation = self._detect_indentation(editor_content)
             line_ending = self._detect_line_ending(editor_content)
@@ -18,6 +18,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop, as main() does for the app, when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def temp_project_dir():
     """Create a temporary directory for test projects."""
@@ -124,6 +124,92 @@ def main():
         # Should return None since LSP components are not actually available
         assert result is None
 
+    
+    @pytest.mark.asyncio
+    async def test_list_files_pattern_filtering(self, agent_tools, tmp_path):
+        """Test that list_files filters by pattern and reports file stats."""
+        (tmp_path / "b.py").write_text("print('b')\n")
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "notes.txt").write_text("notes")
+        (tmp_path / "pkg").mkdir()
+        
+        result = await agent_tools.list_files(str(tmp_path), "*.py")
+        
+        assert result["success"] is True
+        assert [f["name"] for f in result["files"]] == ["a.py", "b.py"]
+        assert result["files"][1]["path"] == str(tmp_path / "b.py")
+        assert result["files"][1]["size"] == len("print('b')\n")
+        assert result["total_directories"] == 0
+        
+        result = await agent_tools.list_files(str(tmp_path), "*")
+        assert result["total_files"] == 3
+        assert [d["name"] for d in result["directories"]] == ["pkg"]
+
+    
+    @pytest.mark.asyncio
+    async def test_search_code_content_and_file_types(self, agent_tools, tmp_path):
+        """Test that search_code matches file contents and honours file_types."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "calc.py").write_text("def add(a, b):\n    return a + b\n")
+        (tmp_path / "notes.md").write_text("remember to DEF ADD docs\n")
+        (tmp_path / "blob.bin").write_bytes(b"def add\x00\x01")
+        
+        result = await agent_tools.search_code(r"def\s+add", str(tmp_path))
+        
+        assert result["success"] is True
+        assert result["files_searched"] == 3
+        assert sorted((m["file"], m["line_number"]) for m in result["matches"]) == [
+            (str(tmp_path / "notes.md"), 1),
+            (str(tmp_path / "pkg" / "calc.py"), 1),
+        ]
+        
+        result = await agent_tools.search_code(r"def\s+add", str(tmp_path), file_types=["py"])
+        assert result["files_searched"] == 1
+        assert [m["line_content"] for m in result["matches"]] == ["def add(a, b):"]
+
+    @pytest.mark.asyncio
+    async def test_search_code_non_ascii(self, agent_tools, tmp_path):
+        """Test that search_code folds non-ASCII case and survives invalid UTF-8."""
+        (tmp_path / "greet.py").write_bytes("x = 1\nname = 'ÉCOLE'\n".encode("utf-8") + b"bad = '\xff'\n")
+        
+        result = await agent_tools.search_code(r"école|bad = '.'", str(tmp_path))
+        
+        assert [(m["line_number"], m["line_content"]) for m in result["matches"]] == [
+            (2, "name = 'ÉCOLE'"),
+            (3, "bad = '\ufffd'"),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_search_code_crlf_line_endings(self, agent_tools, tmp_path):
+        """Test that $ matches at line end in CRLF and CR files, as in LF files."""
+        (tmp_path / "crlf.py").write_bytes(b"foo\r\nbar foo\r\n")
+        (tmp_path / "cr.py").write_bytes(b"foo\rbaz\r")
+        
+        result = await agent_tools.search_code(r"foo$", str(tmp_path))
+        
+        assert sorted((m["file"], m["line_number"], m["line_content"]) for m in result["matches"]) == [
+            (str(tmp_path / "cr.py"), 1, "foo"),
+            (str(tmp_path / "crlf.py"), 1, "foo"),
+            (str(tmp_path / "crlf.py"), 2, "bar foo"),
+        ]
+
+
+    @pytest.mark.asyncio
+    async def test_analyze_structure_python_and_fallback(self, agent_tools, sample_python_code):
+        """Test that _analyze_structure parses Python exactly and falls back for other code."""
+        code = sample_python_code + "\nasync def fetch(\n    url,\n):\n    pass\n"
+
+        result = await agent_tools._analyze_structure(code, "test.py")
+
+        assert [c["name"] for c in result["classes"]] == ["Calculator"]
+        assert [f["name"] for f in result["functions"]][-2:] == ["main", "fetch"]
+        assert result["functions"][0] == {"name": "__init__", "line": 9}
+        assert [i["line"] for i in result["imports"]] == [2, 3, 4]
+
+        result = await agent_tools._analyze_structure("proc add(a: int): int =\n  a\ndef x(:\n", "test.nim")
+        assert result["functions"] == [{"name": "x", "line": 3}]
+        assert result["total_lines"] == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
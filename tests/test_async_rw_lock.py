@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for the coroutine reader-writer lock."""
+
+import asyncio
+
+import pytest
+
+from src.k2edit.utils.async_performance_utils import AsyncRWLock
+
+
+class TestAsyncRWLock:
+    """Test cases for AsyncRWLock"""
+
+    @pytest.mark.asyncio
+    async def test_readers_share_the_lock(self):
+        """Readers hold the lock at the same time."""
+        lock = AsyncRWLock()
+        active = 0
+        peak = 0
+
+        async def read():
+            nonlocal active, peak
+            async with lock.reader:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(read() for _ in range(5)))
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_writer_excludes_readers_and_is_not_starved(self):
+        """A waiting writer runs before readers that arrive after it."""
+        lock = AsyncRWLock()
+        events = []
+
+        async def read(name, delay):
+            await asyncio.sleep(delay)
+            async with lock.reader:
+                events.append(f"{name}+")
+                await asyncio.sleep(0.02)
+                events.append(f"{name}-")
+
+        async def write():
+            await asyncio.sleep(0.005)
+            async with lock.writer:
+                events.append("w+")
+                await asyncio.sleep(0.01)
+                events.append("w-")
+
+        await asyncio.gather(read("r1", 0), write(), read("r2", 0.01))
+        assert events == ["r1+", "r1-", "w+", "w-", "r2+", "r2-"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,6 +5,7 @@ Test to demonstrate improved context filtering for search_relevant_context
 
 import pytest
 import asyncio
+import re
 import json
 import tempfile
 from pathlib import Path
@@ -24,7 +25,8 @@ class MockContextManager:
         # Simple mock embedding
         import hashlib
         hash_val = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
-        return [hash_val % 1000 / 1000.0] * 384
+        # Never all zeros: the store rejects a zero vector as a failed embedding
+        return [(hash_val % 1000 + 1) / 1001.0] * 384
 
 
 def is_low_quality_content(content: dict) -> bool:
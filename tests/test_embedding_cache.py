@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for the persistent, content-addressed embedding cache."""
+
+import pytest
+
+from src.k2edit.agent.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache"""
+
+    def test_round_trip_persists_across_connections(self, tmp_path):
+        """An embedding stored in one session is served to the next."""
+        db_path = tmp_path / ".k2edit" / "emb_cache.sqlite"
+        key = EmbeddingCache.key_for("def add(a, b): return a + b")
+        embedding = [0.5, -0.25, 0.125]
+
+        cache = EmbeddingCache(db_path, model="test-model", dim=3)
+        cache.open()
+        assert cache.get(key) is None
+        cache.put(key, embedding)
+        cache.close()
+
+        reopened = EmbeddingCache(db_path, model="test-model", dim=3)
+        reopened.open()
+        assert reopened.get(key) == pytest.approx(embedding, abs=0.5 / 254)
+        assert reopened.get(EmbeddingCache.key_for("other")) is None
+        reopened.close()
+
+    def test_quantized_vectors_stay_close(self, tmp_path):
+        """Int8 storage keeps every component within half a quantization step."""
+        cache = EmbeddingCache(tmp_path / "emb_cache.sqlite", model="test-model", dim=384)
+        cache.open()
+        embedding = [((i * 37) % 101 - 50) / 400 for i in range(384)]
+        peak = max(abs(x) for x in embedding)
+        cache.put("key", embedding)
+        cache.put("zeros", [0.0] * 384)
+        assert cache.get("key") == pytest.approx(embedding, abs=peak / 254)
+        assert cache.get("zeros") == [0.0] * 384
+        cache.close()
+
+    def test_entries_are_scoped_to_model_and_dim(self, tmp_path):
+        """Vectors from another model or dimension are never served."""
+        db_path = tmp_path / "emb_cache.sqlite"
+        key = EmbeddingCache.key_for("same text")
+
+        cache = EmbeddingCache(db_path, model="model-a", dim=2)
+        cache.open()
+        cache.put(key, [0.5, 0.5])
+        cache.put("wrong-size", [0.5, 0.5, 0.5])
+        assert cache.get("wrong-size") is None
+        cache.close()
+
+        for model, dim in (("model-b", 2), ("model-a", 3)):
+            other = EmbeddingCache(db_path, model=model, dim=dim)
+            other.open()
+            assert other.get(key) is None
+            other.close()
+
+    def test_batched_get_and_put(self, tmp_path):
+        """put_many stores a batch in one transaction; get_many returns only hits."""
+        cache = EmbeddingCache(tmp_path / "emb_cache.sqlite", model="test-model", dim=2)
+        cache.open()
+        keys = [EmbeddingCache.key_for(str(i)) for i in range(3)]
+        cache.put_many([(keys[0], [0.5, -0.5]), (keys[1], [1.0, 0.0]), ("wrong-size", [1.0])])
+
+        found = cache.get_many(keys + ["wrong-size"])
+        assert set(found) == {keys[0], keys[1]}
+        assert found[keys[1]] == pytest.approx([1.0, 0.0])
+        assert cache.get(keys[0]) == pytest.approx([0.5, -0.5], abs=0.5 / 254)
+        cache.close()
+
+    def test_unopened_cache_is_a_no_op(self, tmp_path):
+        """A cache that was never opened misses and ignores writes."""
+        cache = EmbeddingCache(tmp_path / "emb_cache.sqlite", model="test-model", dim=1)
+        cache.put("key", [1.0])
+        cache.put_many([("key", [1.0])])
+        assert cache.get("key") is None
+        assert cache.get_many(["key"]) == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for the shared K2Edit logger."""
+
+import pytest
+from aiologger.handlers.files import AsyncFileHandler
+from aiologger.levels import LogLevel
+
+from src.k2edit.logger import AsyncQueueHandler, BufferedTimedRotatingFileHandler, K2EditLogger
+
+
+class TestK2EditLogger:
+    """Test cases for K2EditLogger"""
+
+    @pytest.mark.asyncio
+    async def test_positional_and_mapping_arguments(self, tmp_path):
+        """printf-style positional args are merged; mapping args still work."""
+        log_file = tmp_path / "k2edit.log"
+        logger = K2EditLogger(name="test", level=LogLevel.INFO)
+        logger.add_handler(AsyncFileHandler(str(log_file)))
+
+        await logger.info("Opened %s in %.1fs", "main.py", 0.25)
+        await logger.info("Single %s", 3)
+        await logger.info("Mapping %(name)s", {"name": "value"})
+        await logger.info("No args 100%")
+        # Disabled levels never format, so mismatched args are harmless
+        await logger.debug("Skipped %s %s", 1)
+        await logger.shutdown()
+
+        assert log_file.read_text().splitlines() == [
+            "Opened main.py in 0.2s",
+            "Single 3",
+            "Mapping value",
+            "No args 100%",
+        ]
+
+
+class TestAsyncQueueHandler:
+    """Test cases for AsyncQueueHandler"""
+
+    @pytest.mark.asyncio
+    async def test_records_reach_target_by_shutdown(self, tmp_path):
+        """Queued records are written in order and flushed on shutdown."""
+        log_file = tmp_path / "k2edit.log"
+        target = AsyncFileHandler(str(log_file))
+        handler = AsyncQueueHandler(target)
+        logger = K2EditLogger(name="test", level=LogLevel.INFO)
+        logger.add_handler(handler)
+
+        for i in range(3):
+            await logger.info("line %s", i)
+        assert handler.initialized
+
+        await logger.shutdown()
+        assert not handler.initialized
+        assert not target.initialized
+        assert log_file.read_text().splitlines() == ["line 0", "line 1", "line 2"]
+
+
+class TestBufferedTimedRotatingFileHandler:
+    """Test cases for BufferedTimedRotatingFileHandler"""
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_capacity_error_and_close(self, tmp_path):
+        """Lines stay buffered until capacity, an error record, or close."""
+        log_file = tmp_path / "k2edit.log"
+        handler = BufferedTimedRotatingFileHandler(
+            filename=str(log_file), when="D", capacity=3, flush_level=LogLevel.ERROR
+        )
+        logger = K2EditLogger(name="test", level=LogLevel.INFO)
+        logger.add_handler(handler)
+
+        await logger.info("a")
+        await logger.info("b")
+        assert log_file.read_text() == ""
+
+        await logger.info("c")
+        assert log_file.read_text().splitlines() == ["a", "b", "c"]
+
+        await logger.info("d")
+        await logger.error("e")
+        assert log_file.read_text().splitlines() == ["a", "b", "c", "d", "e"]
+
+        await logger.info("f")
+        await logger.shutdown()
+        assert log_file.read_text().splitlines()[-1] == "f"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
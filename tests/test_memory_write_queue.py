@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Tests for the ChromaMemoryStore background write queue."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.k2edit.agent.chroma_memory_store import ChromaMemoryStore
+
+
+class MockContextManager:
+    """Embeds any text containing "bad" to a zero vector, as a failed embedding"""
+
+    def __init__(self, model_loaded=True):
+        self.embedding_model = object() if model_loaded else None
+
+    async def _generate_embeddings(self, texts):
+        return [[0.0] * 384 if "bad" in text else [0.1] * 384 for text in texts]
+
+
+class TestMemoryWriteQueue:
+    """Test cases for queued memory writes"""
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_entry(self, tmp_path):
+        """Each queued entry's future carries its own outcome; close() does not raise."""
+        store = ChromaMemoryStore(MockContextManager(), AsyncMock())
+        await store.initialize(str(tmp_path))
+
+        good = await store.store_conversation({"q": "hello"})
+        bad = await store.store_conversation({"q": "bad"})
+        assert not good.done()
+
+        await store.flush()
+        assert await good is None
+        with pytest.raises(RuntimeError):
+            await bad
+        assert len(await store.get_recent_conversations()) == 1
+
+        await store.store_conversation({"q": "bad again"})
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_directly_before_the_model_loads(self, tmp_path):
+        """Without a loaded model the entry is written at once instead of queued."""
+        store = ChromaMemoryStore(MockContextManager(model_loaded=False), AsyncMock())
+        await store.initialize(str(tmp_path))
+
+        future = await store.store_context("a.py", {"code": "bad"})
+        assert future.done()
+        assert isinstance(future.exception(), RuntimeError)
+        await store.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])